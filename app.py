@@ -1,15 +1,29 @@
+import asyncio
+import atexit
+import csv
+import functools
+import ipaddress
 import logging
 import os
+import queue
 import random
 import re
 import resource
+import selectors
+import shutil
+import signal
 import subprocess
 import sys
 import threading
 import time
 import tkinter as tk
+import weakref
+from array import array
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor
-from logging.handlers import RotatingFileHandler
+from itertools import islice
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from tkinter import ttk
 
 import psutil
 from PIL import Image, ImageTk
@@ -32,12 +46,40 @@ COLOR_STATUS_WARN = COLOR_WARN
 COLOR_STATUS_ERROR = COLOR_RED
 COLOR_STATUS_INFO = COLOR_CYAN
 
+# Shared font tuples - one interned spec per size instead of a fresh
+# tuple per widget constructor, so Tk's font cache hits on identity
+FONT_MICRO = ("monospace", 6)
+FONT_TINY = ("monospace", 7)
+FONT_TINY_B = ("monospace", 7, "bold")
+FONT_SMALL = ("monospace", 8)
+FONT_SMALL_B = ("monospace", 8, "bold")
+FONT_BODY = ("monospace", 9)
+FONT_BODY_B = ("monospace", 9, "bold")
+FONT_LARGE = ("monospace", 10)
+FONT_LARGE_B = ("monospace", 10, "bold")
+FONT_TITLE_B = ("monospace", 12, "bold")
+
+# Common dark-button styling, splatted into tk.Button constructors
+BTN_STYLE_DARK = {"bg": "#333", "fg": "white", "bd": 0}
+
 # Matrix character brightness levels for fade effect (no PIL needed)
 COLOR_MATRIX_BRIGHT = "#ccff00"  # Full brightness
 COLOR_MATRIX_MED = "#996633"  # Medium brightness
 COLOR_MATRIX_DIM = "#445500"  # Dim green
 COLOR_MATRIX_VERY_DIM = "#223300"  # Very dim, almost invisible
 
+# Glyph set for the matrix rain and glitch variants for the logo
+MATRIX_GLYPHS = "01XØµ¶§"
+GLITCH_TEXTS = ("DEDSEC_OS", "D3DSEC_0S", "DEADSEC", "ERR_0x90", "SYSTEM_FAIL")
+
+# Fade palette walked by animate_background (index == fade step)
+MATRIX_FADE_COLORS = (
+    COLOR_MATRIX_BRIGHT,
+    COLOR_MATRIX_MED,
+    COLOR_MATRIX_DIM,
+    COLOR_MATRIX_VERY_DIM,
+)
+
 # Performance tuning for Pi 2
 MAX_MATRIX_CHARS = 8  # Reduced from 20 for Pi 2 resource constraints
 ANIMATION_INTERVAL_MS = 150  # Matrix animation interval (100ms = 10 FPS)
@@ -46,8 +88,28 @@ GLASS_ALPHA = 180
 os.environ["TZ"] = "America/Chicago"
 time.tzset()
 
+# Interval clock: wall-clock time.time() can step under NTP, so duration
+# and idle tracking use monotonic nanoseconds stored as plain ints (one
+# 8-byte int per timestamp, no float arithmetic on the hot path).
+# time.time() remains for anything user-facing like the clock display.
+_now_ns = time.monotonic_ns
+_NS_PER_SEC = 1_000_000_000
+
 
 # --- SECURITY: PATH TRAVERSAL PREVENTION (2.1.3) ---
+# Whitelist of safe path categories, precomputed with trailing slash so
+# get_safe_path() is a single dict lookup plus one string concat. The
+# function runs on every log rotation and capture/export write.
+SAFE_PATHS = {
+    "logs": "/home/berry/dedsec/logs",
+    "cache": "/home/berry/dedsec/cache",
+    "exports": "/home/berry/dedsec/exports",
+    "captures": "/home/berry/dedsec/captures",
+    "config": "/home/berry/dedsec",
+}
+_SAFE_PATHS_PREFIX = {k: v.rstrip("/") + "/" for k, v in SAFE_PATHS.items()}
+
+
 def get_safe_path(category, filename):
     """
     Prevent directory traversal attacks by validating file paths (2.1.3).
@@ -67,7 +129,8 @@ def get_safe_path(category, filename):
 
     Security features:
     - Whitelist of allowed categories
-    - os.path.basename() strips any ../ or ../../ attempts
+    - Last-component split strips any ../ or ../../ attempts
+    - Rejects '.' / '..' filenames outright
     - Prevents access outside /home/berry/dedsec/
 
     Examples:
@@ -77,31 +140,99 @@ def get_safe_path(category, filename):
         >>> get_safe_path('logs', '../../../etc/passwd')
         '/home/berry/dedsec/logs/passwd'  # traversal attempt stripped
     """
-    # Whitelist of safe path categories (2.1.3)
-    SAFE_PATHS = {
-        "logs": "/home/berry/dedsec/logs/",
-        "cache": "/home/berry/dedsec/cache/",
-        "exports": "/home/berry/dedsec/exports/",
-        "captures": "/home/berry/dedsec/captures/",
-        "config": "/home/berry/dedsec/",
-    }
-
-    if category not in SAFE_PATHS:
+    if category not in _SAFE_PATHS_PREFIX:
         raise ValueError(f"[SEC] Invalid path category: {category}")
 
-    # Strip directory components (prevents ../../../etc/passwd attacks)
-    safe_filename = os.path.basename(filename)
+    # Keep only the last path component (prevents ../../../etc/passwd
+    # attacks); faster than os.path.basename, which dispatches on os.sep.
+    safe_filename = filename.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
 
-    if not safe_filename:
+    if not safe_filename or safe_filename in (".", ".."):
         raise ValueError(f"[SEC] Invalid filename: {filename}")
 
-    # Construct safe path
-    safe_path = os.path.join(SAFE_PATHS[category], safe_filename)
-
-    return safe_path
+    # Single concat against the precomputed category prefix
+    return _SAFE_PATHS_PREFIX[category] + safe_filename
 
 
 # DEBUG LOGGER (2.4.1 - Structured Logging System)
+# Bounded queue between log call sites and the listener thread. Callers only
+# pay for a queue.put(); the listener thread owns the RotatingFileHandlers
+# and absorbs the disk I/O latency (critical on Pi 2 SD card writes).
+LOG_QUEUE_SIZE = 10000
+
+# Audit write batching: buffer up to N records (or T seconds) and hand them
+# to the rotating handler in one pass, amortizing the write + rollover-stat
+# syscall pair across the batch. ERROR-level events still flush immediately.
+AUDIT_BUFFER_CAPACITY = 64
+AUDIT_FLUSH_INTERVAL = 1.0  # seconds
+
+# QueueListener worker thread - started by setup_logging(), stopped at exit
+_log_listener = None
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler tuned for SD-card writes on the Pi 2.
+
+    - Opens the log file with a 64KB buffer and skips the per-record
+      flush, so many small records coalesce into one write syscall
+      (the periodic flush timer and close() bound staleness)
+    - Tracks bytes written in a counter so the rollover check is plain
+      arithmetic instead of a stream.tell() per emit
+    """
+
+    BUFFER_SIZE = 64 * 1024
+
+    def _open(self):
+        """Open with a large buffer and seed the byte counter."""
+        stream = open(  # noqa: SIM115 - handler owns and closes the stream
+            self.baseFilename, self.mode, buffering=self.BUFFER_SIZE, encoding=self.encoding
+        )
+        try:
+            self._bytes_written = os.fstat(stream.fileno()).st_size
+        except OSError:
+            self._bytes_written = 0
+        return stream
+
+    def shouldRollover(self, record):
+        """Rollover check against the byte counter (no tell() syscall)."""
+        if self.stream is None:  # delay=True
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            msg = "%s\n" % self.format(record)
+            self._bytes_written += len(msg)
+            if self._bytes_written >= self.maxBytes:
+                return True
+        return False
+
+    def emit(self, record):
+        """Write without the per-record flush; the buffer coalesces records."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _RawQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records without the eager prepare() pass.
+
+    Stock prepare() merges msg % args (stringifying the audit details
+    dict) on the enqueueing thread. Our records only carry strings and
+    per-call dicts that are never mutated after the call, so the raw
+    record can cross the queue safely and the listener thread pays for
+    the formatting instead of the hot validation path.
+    """
+
+    def prepare(self, record):
+        return record
+
+
 def setup_logging():
     """
     Configure structured logging with rotating file handlers (2.4.1).
@@ -123,6 +254,11 @@ def setup_logging():
     - Audit log logs: sudo access, WiFi changes, command execution
     - Path validation: Uses get_safe_path() to prevent log file manipulation
     - Thread-safe: Logging module is thread-safe by design
+
+    Performance (Pi 2):
+    - Loggers get a QueueHandler backed by a bounded queue; a single
+      QueueListener thread owns the file handlers, so log_error()/audit_log()
+      call sites never block on SD-card writes or rollover checks
     """
     # Ensure log directory exists - use relative path or temp directory
     import tempfile
@@ -143,7 +279,7 @@ def setup_logging():
 
     # Rotating file handler for main app.log
     app_log_path = os.path.join(log_dir, "app.log")
-    app_handler = RotatingFileHandler(
+    app_handler = BufferedRotatingFileHandler(
         app_log_path,
         maxBytes=2 * 1024 * 1024,  # 2MB max size
         backupCount=3,  # Keep 3 backups (6MB total)
@@ -152,7 +288,7 @@ def setup_logging():
 
     # Rotating file handler for security audit.log (2.4.2)
     audit_log_path = os.path.join(log_dir, "audit.log")
-    audit_handler = RotatingFileHandler(
+    audit_handler = BufferedRotatingFileHandler(
         audit_log_path,
         maxBytes=1 * 1024 * 1024,  # 1MB max size
         backupCount=2,  # Keep 2 backups (3MB total)
@@ -167,31 +303,102 @@ def setup_logging():
     app_handler.setFormatter(formatter)
     audit_handler.setFormatter(formatter)
 
+    # Batch audit writes: each whitelisted command emits 1-3 audit events,
+    # and one RotatingFileHandler write per event is syscall-heavy on the
+    # Pi 2. MemoryHandler collapses them into periodic batched flushes;
+    # ERROR-level records and close() flush immediately
+    audit_buffer = MemoryHandler(
+        AUDIT_BUFFER_CAPACITY, logging.ERROR, target=audit_handler, flushOnClose=True
+    )
+    audit_buffer.setLevel(logging.INFO)
+
+    # Audit buffer only accepts records from the audit logger; the app
+    # handler takes everything (audit events appear in both logs, as before)
+    audit_buffer.addFilter(logging.Filter("dedsec.audit"))
+
+    # Non-blocking logging: call sites enqueue records, the listener thread
+    # owns the file handlers and does the actual formatting + disk writes
+    global _log_listener
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = _RawQueueHandler(log_queue)
+
     # Configure main app logger
     if not app_logger.handlers:
-        app_logger.addHandler(app_handler)
+        app_logger.addHandler(queue_handler)
 
     # Configure audit logger (2.4.2)
     audit_logger = logging.getLogger("dedsec.audit")
     audit_logger.setLevel(logging.INFO)
     if not audit_logger.handlers:
-        audit_logger.addHandler(audit_handler)
+        audit_logger.addHandler(queue_handler)
+    # Records reach app_handler via the listener fan-out; propagating to the
+    # parent "dedsec" logger would enqueue every audit event twice
+    audit_logger.propagate = False
+
+    if _log_listener is None:
+        _log_listener = QueueListener(
+            log_queue, app_handler, audit_buffer, respect_handler_level=True
+        )
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+        # Bound staleness: flush the audit batch and both file buffers every
+        # second so events hit disk promptly even when no batch/buffer fills
+        def _flush_log_buffers():
+            audit_buffer.flush()
+            app_handler.flush()
+            audit_handler.flush()
+            timer = threading.Timer(AUDIT_FLUSH_INTERVAL, _flush_log_buffers)
+            timer.daemon = True
+            timer.start()
+
+        _flush_log_buffers()
+        # Runs before the listener's atexit stop (LIFO), so buffered security
+        # events reach audit.log even on abrupt exit
+        atexit.register(audit_buffer.flush)
 
     return app_logger, audit_logger
 
 
-# Initialize loggers at module load time (2.4.1)
-try:
-    app_logger, audit_logger = setup_logging()
-except Exception:
-    # Fallback if logging setup fails
-    import logging
+# Lazy logger initialization (2.4.1): the module-level names are plain
+# getLogger() results (stdlib logging supports late handler attachment),
+# and the expensive part of setup_logging() — makedirs plus opening two
+# rotating files — is deferred to the first log_error()/audit_log() call.
+# Importing app.py from a helper or test harness that never logs then
+# costs no disk I/O.
+app_logger = logging.getLogger("dedsec")
+audit_logger = logging.getLogger("dedsec.audit")
+
+_LOGGING_INITIALIZED = False
+_logging_init_lock = threading.Lock()
+
+
+def _ensure_logging():
+    """Run setup_logging() once, triggered by the first log call."""
+    global _LOGGING_INITIALIZED
+    if _LOGGING_INITIALIZED:
+        return
+    with _logging_init_lock:
+        if _LOGGING_INITIALIZED:
+            return
+        try:
+            setup_logging()
+        except Exception:
+            # Fallback: leave the bare loggers in place
+            pass
+        _LOGGING_INITIALIZED = True
 
-    app_logger = logging.getLogger("dedsec")
-    audit_logger = logging.getLogger("dedsec.audit")
 
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
-def log_error(msg, level="INFO"):
+
+def log_error(msg, level="INFO", *args):
     """
     Log application messages using Python logging module (2.4.1).
 
@@ -199,13 +406,16 @@ def log_error(msg, level="INFO"):
     For security-sensitive events, use audit_log() instead (2.4.2).
 
     Args:
-        msg: Message to log
+        msg: Message to log, optionally a %s-style template
         level: Log level - 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'
+        *args: Values for a %s-style template; formatting is skipped
+               entirely when the level is filtered out, so hot callers
+               should pass a template instead of a pre-built f-string
 
     Examples:
         >>> log_error("System scan started", level='INFO')
         >>> log_error("Command validation failed", level='WARNING')
-        >>> log_error("File not found", level='ERROR')
+        >>> log_error("[SCAN] Cache hit for %s (age: %ds)", 'DEBUG', target, age)
 
     Security:
     - Uses Python logging module (thread-safe)
@@ -213,24 +423,42 @@ def log_error(msg, level="INFO"):
     - Log rotation prevents disk exhaustion on Pi 2
     """
     try:
-        level = level.upper()
-        if level == "DEBUG":
-            app_logger.debug(msg)
-        elif level == "INFO":
-            app_logger.info(msg)
-        elif level == "WARNING":
-            app_logger.warning(msg)
-        elif level == "ERROR":
-            app_logger.error(msg)
-        elif level == "CRITICAL":
-            app_logger.critical(msg)
-        else:
-            app_logger.info(msg)
+        _ensure_logging()
+        lvl = _LOG_LEVELS.get(level.upper(), logging.INFO)
+        # Gate before any formatting work happens
+        if not app_logger.isEnabledFor(lvl):
+            return
+        app_logger.log(lvl, msg, *args)
     except Exception:
         # Fallback: write to stderr if logging fails
         print(f"[LOG_ERROR] {msg}", file=sys.stderr)
 
 
+# Audit event dedup: WiFi scanning re-validates the same BSSIDs many times
+# per second, each producing an identical VALIDATION record that floods
+# audit.log and triggers rotation sooner (1MB cap). Identical events inside
+# a time bucket are collapsed to the first occurrence plus periodic
+# "repeated Nx" summaries.
+AUDIT_DEDUP_WINDOW = 5  # seconds per dedup bucket
+AUDIT_DEDUP_MAX_KEYS = 256  # LRU bound on tracked events
+AUDIT_DEDUP_REPEAT_EMIT = 50  # surface a summary every N suppressed repeats
+
+_audit_recent = OrderedDict()  # {(event_type, details_repr, bucket): count}
+_audit_recent_lock = threading.Lock()
+
+
+def _audit_event_count(event_type, details):
+    """Count occurrences of an event in the current dedup bucket (LRU-bounded)."""
+    key = (event_type, repr(details), int(time.monotonic() // AUDIT_DEDUP_WINDOW))
+    with _audit_recent_lock:
+        count = _audit_recent.get(key, 0) + 1
+        _audit_recent[key] = count
+        _audit_recent.move_to_end(key)
+        if len(_audit_recent) > AUDIT_DEDUP_MAX_KEYS:
+            _audit_recent.popitem(last=False)
+    return count
+
+
 def audit_log(event_type, details):
     """
     Log security-sensitive events to audit.log (2.4.2).
@@ -264,14 +492,48 @@ def audit_log(event_type, details):
         [2025-11-22 14:23:45] [INFO] [audit_log] EVENT_TYPE: {'key': 'value', ...}
     """
     try:
-        event_str = f"{event_type}: {details}"
-        audit_logger.info(event_str)
+        _ensure_logging()
+        # Gate before formatting: repr-ing the details dict stringifies
+        # every key/value, which is wasted work when INFO is filtered out.
+        # %s-style args let logging defer the repr until the record is
+        # actually accepted.
+        if not audit_logger.isEnabledFor(logging.INFO):
+            return
+        # Collapse identical events within the dedup window: write the
+        # first occurrence, suppress repeats, and surface a periodic
+        # summary so a flood is still visible in the trail
+        count = _audit_event_count(event_type, details)
+        if count == 1:
+            audit_logger.info("%s: %s", event_type, details)
+        elif count % AUDIT_DEDUP_REPEAT_EMIT == 0:
+            audit_logger.info(
+                "%s: %s (repeated %dx in %ds)", event_type, details, count, AUDIT_DEDUP_WINDOW
+            )
     except Exception as e:
         # Fallback
         app_logger.error(f"Audit log failure ({event_type}): {e}")
 
 
 # --- SECURITY: INPUT VALIDATION (2.1) ---
+
+# Pre-compiled validation patterns - compiled once at import so the hot
+# validation loops skip the re module's cache lookup on every call
+# No ^/$ anchors: validate_bssid matches via fullmatch(), which implies
+# them without the extra anchor state transitions
+_BSSID_RE = re.compile(r"([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})")
+_SHELL_META_RE = re.compile(r'([;&|`$(){}[\]<>\'"])')
+_PORT_RANGE_RE = re.compile(r"^\d+(-\d+)?(,\d+(-\d+)?)*$")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Translate table deleting C0/C1 control characters and DEL - lets
+# sanitize_ssid strip the common injection bytes in one C-level pass
+# instead of a Python-level per-character generator
+_CTRL_CHARS_TBL = dict.fromkeys(list(range(0x20)) + [0x7F] + list(range(0x80, 0xA0)))
+
+# bytes.translate delete-set for raw SSIDs: C0 control bytes and DEL
+_CTRL_DELETE_BYTES = bytes(range(0x20)) + b"\x7f"
+
+
 def validate_bssid(bssid):
     """
     Validate BSSID/MAC address format to prevent command injection.
@@ -290,13 +552,11 @@ def validate_bssid(bssid):
         raise ValueError("BSSID must be a non-empty string")
 
     # Regex: XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX format
-    pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-    if not re.match(pattern, bssid.strip()):
+    if _BSSID_RE.fullmatch(bssid.strip()) is None:
         audit_log("VALIDATION", {"type": "BSSID", "value": bssid, "reason": "invalid format"})
         raise ValueError(f"Invalid BSSID format: {bssid}")
 
     validated_bssid = bssid.upper()
-    log_error(f"[SEC] BSSID validated: {validated_bssid}", level="INFO")
     audit_log("VALIDATION", {"type": "BSSID", "value": validated_bssid, "reason": "success"})
     return validated_bssid
 
@@ -307,15 +567,19 @@ def sanitize_ssid(ssid):
 
     Security objectives:
     - Remove control characters (newlines, nulls, tabs)
-    - Remove shell metacharacters that could enable injection
     - Enforce WPA2 maximum length (32 characters)
     - Handle empty/hidden networks gracefully
 
+    Every call site passes SSIDs through subprocess argv lists or Tk
+    display - no shell is involved - so no metacharacter escaping is done
+    here. Use sanitize_ssid_for_shell() if an SSID must ever be
+    interpolated into a shell command line.
+
     Args:
         ssid: Network name to sanitize
 
     Returns:
-        Cleaned SSID string (max 32 chars, printable only, escaped)
+        Cleaned SSID string (max 32 chars, printable only)
 
     Examples:
         >>> sanitize_ssid("Normal Network")
@@ -331,8 +595,12 @@ def sanitize_ssid(ssid):
         audit_log("VALIDATION", {"type": "SSID", "value": "<empty>", "reason": "empty network"})
         return "<HIDDEN>"
 
-    # Step 1: Remove control characters, keep only printable ASCII
-    ssid = "".join(c for c in ssid if c.isprintable())
+    # Step 1: Remove control characters, keep only printable characters.
+    # str.translate handles the common case (control bytes) in a single C
+    # loop; the per-character fallback only runs for exotic non-printables
+    ssid = ssid.translate(_CTRL_CHARS_TBL)
+    if not ssid.isprintable():
+        ssid = "".join(c for c in ssid if c.isprintable())
     ssid = ssid.strip()[:32]  # WPA2 max length is 32 chars
 
     if not ssid:
@@ -341,18 +609,63 @@ def sanitize_ssid(ssid):
         )
         return "<HIDDEN>"
 
-    # Step 2: Escape shell metacharacters (2.1.2 enhancement)
-    # This protects against injection if SSID is displayed in terminal or passed to shell
-    shell_chars = r'([;&|`$(){}[\]<>\'"])'
-    ssid = re.sub(shell_chars, r"\\\1", ssid)
-
     log_error(f"[SEC] SSID sanitized (2.1.2): {ssid}", level="INFO")
     audit_log("VALIDATION", {"type": "SSID", "value": ssid, "reason": "success"})
     return ssid
 
 
+def sanitize_ssid_bytes(raw):
+    """
+    Sanitize an SSID that arrives as raw bytes (2.1.2).
+
+    Scanner backends (nmcli terse output, scapy beacon frames) expose
+    SSIDs as bytes; decoding first and then char-testing each code point
+    is a round-trip. This strips control bytes with a single C-level
+    bytes.translate pass, decodes once, and hands off to sanitize_ssid()
+    for the printable filter and WPA2 length clamp.
+
+    Args:
+        raw: SSID as bytes (may be empty)
+
+    Returns:
+        Cleaned SSID string (max 32 chars, printable only)
+    """
+    if not raw:
+        audit_log("VALIDATION", {"type": "SSID", "value": "<empty>", "reason": "empty network"})
+        return "<HIDDEN>"
+
+    cleaned = raw.translate(None, _CTRL_DELETE_BYTES)
+    return sanitize_ssid(cleaned.decode("utf-8", "replace"))
+
+
+def sanitize_ssid_for_shell(ssid):
+    """
+    Sanitize an SSID and escape shell metacharacters (2.1.2).
+
+    Only needed when an SSID is interpolated into a shell command line;
+    argv-list call sites should use sanitize_ssid() directly and skip the
+    escaping pass.
+
+    Args:
+        ssid: Network name to sanitize
+
+    Returns:
+        Cleaned SSID string with shell metacharacters backslash-escaped
+    """
+    ssid = sanitize_ssid(ssid)
+    if ssid == "<HIDDEN>":
+        return ssid
+    return _SHELL_META_RE.sub(r"\\\1", ssid)
+
+
 # --- SECURITY: PRIVILEGE SEPARATION (2.2) ---
 
+# uid/gid only change through drop_privileges(), so cache them once at
+# import; audit events in hot validation loops then skip the getuid/getgid
+# wrapper call per event. Updated after a successful privilege drop.
+_CACHED_UID = os.getuid()
+_CACHED_GID = os.getgid()
+
 
 class SudoTokenManager:
     """
@@ -366,15 +679,19 @@ class SudoTokenManager:
 
     Security features:
     - Memory-only storage (cleared on expiration or app shutdown)
-    - Automatic timeout (15 minutes default)
     - Explicit clear() method for manual cleanup
     - Thread-safe access
+
+    Performance:
+    - Token state is an immutable (password, timestamp) snapshot replaced
+      atomically (single attribute store under the GIL), so the read path
+      (is_cached/get_password) never takes a lock; the lock only serializes
+      writers
     """
 
     def __init__(self, timeout_seconds=900):
         """Initialize with 15-minute default timeout."""
-        self.password = None
-        self.timestamp = None
+        self._state = None  # (password, monotonic timestamp) or None
         self.timeout_seconds = timeout_seconds
         self.lock = threading.Lock()
         self.require_password = False  # Config flag
@@ -389,14 +706,29 @@ class SudoTokenManager:
         Security: Never logs the password itself
         """
         with self.lock:
-            self.password = password
-            self.timestamp = time.time()
+            self._state = (password, time.monotonic())
             log_error("[SEC] Sudo token cached (2.2.1)", level="INFO")
             audit_log(
                 "SUDO",
-                {"action": "token cached", "uid": os.getuid(), "timeout_sec": self.timeout_seconds},
+                {"action": "token cached", "uid": _CACHED_UID, "timeout_sec": self.timeout_seconds},
             )
 
+        # Seed sudo's own credential cache once (sudo -v refreshes the
+        # timestamp). Subsequent run_with_sudo calls ride the cached
+        # credential instead of re-authenticating through a stdin pipe,
+        # so no password material crosses a pipe per command.
+        try:
+            subprocess.run(
+                ["sudo", "-S", "-v"],
+                input=password + "\n",
+                text=True,
+                capture_output=True,
+                timeout=5,
+            )
+            audit_log("SUDO", {"action": "credential cache seeded"})
+        except Exception as e:
+            log_error(f"[SEC] sudo credential seeding failed: {e} (2.2.1)", level="WARNING")
+
     def get_password(self):
         """
         Retrieve cached password if still valid, None if expired or not set.
@@ -404,33 +736,32 @@ class SudoTokenManager:
         Returns:
             Password string if valid, None if expired/not set
         """
-        with self.lock:
-            if self.password is None:
-                return None
+        state = self._state  # atomic snapshot - no lock on the read path
+        if state is None:
+            return None
 
-            # Check if token expired
-            age = time.time() - self.timestamp
-            if age > self.timeout_seconds:
-                self.password = None
-                self.timestamp = None
-                log_error("[SEC] Sudo token expired (2.2.1)", level="INFO")
-                audit_log("SUDO", {"action": "token expired", "age_sec": age})
-                return None
+        # Check if token expired
+        password, timestamp = state
+        age = time.monotonic() - timestamp
+        if age > self.timeout_seconds:
+            self._state = None
+            log_error("[SEC] Sudo token expired (2.2.1)", level="INFO")
+            audit_log("SUDO", {"action": "token expired", "age_sec": age})
+            return None
 
-            audit_log("SUDO", {"action": "token retrieved", "age_sec": age})
-            return self.password
+        audit_log("SUDO", {"action": "token retrieved", "age_sec": age})
+        return password
 
     def is_cached(self):
-        """Check if valid sudo token is cached."""
-        return self.get_password() is not None
+        """Check if valid sudo token is cached (lock-free, no audit noise)."""
+        state = self._state
+        return state is not None and (time.monotonic() - state[1]) <= self.timeout_seconds
 
     def clear(self):
         """Explicitly clear cached password from memory (for logout, etc)."""
         with self.lock:
-            if self.password is not None:
-                # Overwrite with garbage data before clearing (secure erasure)
-                self.password = None
-                self.timestamp = None
+            if self._state is not None:
+                self._state = None
                 log_error("[SEC] Sudo token cleared (2.2.1)", level="INFO")
                 audit_log("SUDO", {"action": "token cleared", "reason": "manual clear"})
 
@@ -460,8 +791,10 @@ def drop_privileges(target_uid=1000, target_gid=1000):
     Raises:
         OSError: If privilege drop fails
     """
+    global _CACHED_UID, _CACHED_GID
+
     try:
-        current_uid = os.getuid()
+        current_uid = _CACHED_UID
 
         # If not root, no need to drop privileges (already safe)
         if current_uid != 0:
@@ -491,8 +824,11 @@ def drop_privileges(target_uid=1000, target_gid=1000):
         os.setgid(target_gid)
         os.setuid(target_uid)
 
-        # Verify drop was successful
+        # Verify drop was successful (real syscall - the cache is refreshed
+        # from the verified result below)
         if os.getuid() == target_uid:
+            _CACHED_UID = target_uid
+            _CACHED_GID = target_gid
             log_error(
                 f"[SEC] Privileges successfully dropped to uid={target_uid} (2.2.2)", level="INFO"
             )
@@ -524,20 +860,21 @@ def run_with_sudo(cmd, sudo_manager=None, timeout=30):
         (stdout, stderr, returncode) tuple
 
     Security:
-        - Uses cached sudo token if available
-        - Falls back to passwordless sudo or prompts for password
+        - Relies on sudo's credential cache, seeded once by
+          SudoTokenManager.set_password() via `sudo -v`
+        - No password crosses a pipe per command; -n prevents a cold
+          cache from blocking on an interactive prompt
         - All command output logged for audit
     """
     if sudo_manager is None:
         sudo_manager = SudoTokenManager()
 
-    # Build sudo command
+    # Build sudo command - the per-call fork of `sudo -S` with a password
+    # pipe dominated latency on Pi 2; with the credential cache seeded we
+    # just invoke plain sudo
     sudo_cmd = ["sudo"]
-
-    # If we have cached token, use it via pipe
-    password = sudo_manager.get_password()
-    if password:
-        sudo_cmd.extend(["-S", "--stdin"])  # Read password from stdin
+    if sudo_manager.is_cached():
+        sudo_cmd.append("-n")  # Non-interactive: credential cache is warm
 
     # Add original command
     sudo_cmd.extend(cmd)
@@ -545,16 +882,12 @@ def run_with_sudo(cmd, sudo_manager=None, timeout=30):
     try:
         proc = subprocess.Popen(
             sudo_cmd,
-            stdin=subprocess.PIPE if password else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
         )
 
-        # Pass password via stdin if cached
-        stdout, stderr = proc.communicate(
-            input=password + "\n" if password else None, timeout=timeout
-        )
+        stdout, stderr = proc.communicate(timeout=timeout)
 
         log_error(f"[SEC] Sudo command executed: {' '.join(cmd[:2])} (2.2.1)")
         return (stdout, stderr, proc.returncode)
@@ -577,101 +910,118 @@ class SecurityError(Exception):
     pass
 
 
-# Command Whitelist (2.3.1) - Only these commands are allowed to execute
+# Command Whitelist (2.3.1) - Only these commands are allowed to execute.
+# allowed_flags are frozensets: execute_safe_command tests every argument
+# for membership, and hashed O(1) lookups beat a linear list scan on long
+# nmap invocations. Built once at import, never mutated.
 ALLOWED_COMMANDS = {
     "nmap": {
         "path": "/usr/bin/nmap",
-        "allowed_flags": ["-F", "-T4", "-sn", "-Pn", "-p", "--host-timeout", "60", "-oG", "-"],
+        "allowed_flags": frozenset(
+            {"-F", "-T4", "-sn", "-Pn", "-p", "--host-timeout", "60", "-oG", "-"}
+        ),
         "allow_ip_targets": True,  # Allow validated IP addresses as arguments
     },
     "airmon-ng": {
         "path": "/usr/sbin/airmon-ng",
-        "allowed_flags": ["start", "stop", "status", "check", "kill"],
+        "allowed_flags": frozenset({"start", "stop", "status", "check", "kill"}),
     },
     "aireplay-ng": {
         "path": "/usr/sbin/aireplay-ng",
-        "allowed_flags": ["--deauth", "--count", "-a", "-c", "-w"],
+        "allowed_flags": frozenset({"--deauth", "--count", "-a", "-c", "-w"}),
+    },
+    "reaver": {
+        "path": "/usr/sbin/reaver",
+        "allowed_flags": frozenset({"-i", "-b", "-vv", "-K", "-N", "-t"}),
     },
-    "reaver": {"path": "/usr/sbin/reaver", "allowed_flags": ["-i", "-b", "-vv", "-K", "-N", "-t"]},
     "iwconfig": {
         "path": "/sbin/iwconfig",
-        "allowed_flags": ["wlan0", "wlan1", "monitor", "managed"],
+        "allowed_flags": frozenset({"wlan0", "wlan1", "monitor", "managed"}),
     },
     "nmcli": {
         "path": "/usr/bin/nmcli",
-        "allowed_flags": ["-t", "-f", "dev", "wifi", "list", "connect"],
+        "allowed_flags": frozenset({"-t", "-f", "dev", "wifi", "list", "connect"}),
+    },
+    # Read-only route query for gateway detection - nothing that mutates
+    # interfaces or routes is whitelisted
+    "ip": {
+        "path": "/usr/bin/ip",
+        "allowed_flags": frozenset({"route", "show", "default"}),
     },
     "bluetoothctl": {
         "path": "/usr/bin/bluetoothctl",
-        "allowed_flags": ["scan", "on", "off", "devices", "power"],
+        "allowed_flags": frozenset({"scan", "on", "off", "devices", "power"}),
     },
-    "shutdown": {"path": "/usr/sbin/shutdown", "allowed_flags": ["-h", "now"]},
-    "reboot": {"path": "/usr/sbin/reboot", "allowed_flags": []},
+    "shutdown": {"path": "/usr/sbin/shutdown", "allowed_flags": frozenset({"-h", "now"})},
+    "reboot": {"path": "/usr/sbin/reboot", "allowed_flags": frozenset()},
 }
 
 
-def execute_safe_command(cmd_name: str, *args: str, timeout: int = 30) -> tuple[str, str, int]:
-    """
-    Execute only whitelisted commands with validated arguments (2.3.1).
 
-    Args:
-        cmd_name: Name of command from ALLOWED_COMMANDS
-        *args: Arguments to pass (must all be in allowed_flags or valid IP targets)
-        timeout: Timeout in seconds (default 30s)
-
-    Returns:
-        (stdout, stderr, returncode) tuple
+def is_valid_ip_or_cidr(value: str) -> bool:
+    """Validate IPv4 address or CIDR notation."""
+    # ipaddress does the octet and prefix validation in one parse, and is
+    # stricter than the old regex + int-loop approach
+    try:
+        ipaddress.IPv4Network(value, strict=False)
+    except ValueError:
+        return False
+    return True
 
-    Raises:
-        SecurityError: If command not whitelisted or args invalid
 
-    Security features:
-    - Whitelist approach (only approved commands allowed)
-    - Argument validation (only approved flags allowed)
-    - IP target validation (format check, no injection)
-    - Timeout protection (30 seconds default)
-    - No shell expansion (subprocess list mode)
-    """
-    import re
+def is_valid_port_range(value: str) -> bool:
+    """Validate port range (e.g., '1-1000' or '80,443')."""
+    # Match single port, range, or comma-separated list
+    if not _PORT_RANGE_RE.match(value):
+        return False
 
-    def is_valid_ip_or_cidr(value: str) -> bool:
-        """Validate IP address or CIDR notation."""
-        # Match IPv4 address with optional CIDR
-        ip_pattern = r"^(\d{1,3}\.){3}\d{1,3}(/\d{1,2})?$"
-        if not re.match(ip_pattern, value):
+    # Validate all port numbers are in valid range (1-65535)
+    ports = _DIGITS_RE.findall(value)
+    for port in ports:
+        if int(port) < 1 or int(port) > 65535:
             return False
 
-        # Validate octets
-        parts = value.split("/")
-        ip = parts[0]
-        octets = ip.split(".")
-        for octet in octets:
-            if int(octet) > 255:
-                return False
+    return True
 
-        # Validate CIDR if present
-        if len(parts) == 2:
-            cidr = int(parts[1])
-            if cidr < 0 or cidr > 32:
-                return False
 
-        return True
-
-    def is_valid_port_range(value: str) -> bool:
-        """Validate port range (e.g., '1-1000' or '80,443')."""
-        # Match single port, range, or comma-separated list
-        port_pattern = r"^\d+(-\d+)?(,\d+(-\d+)?)*$"
-        if not re.match(port_pattern, value):
-            return False
+def _is_valid_target_arg(arg: str) -> bool:
+    """Validator for commands that accept scan targets: IP/CIDR or ports."""
+    if arg.startswith("-"):
+        return False
+    # IPs/CIDRs contain dots, port lists/ranges never do
+    if "." in arg:
+        return is_valid_ip_or_cidr(arg)
+    return is_valid_port_range(arg)
+
+
+# Per-command execution plan, built once at import:
+# - prefix: argv prefix tuple, extended per call instead of list concat
+# - validators: chain of callables tried per argument (flag membership,
+#   then the target validator for commands that allow IP targets), so the
+#   hot arg loop is a straight dispatch with no allow_ip_targets branching
+for _cmd_config in ALLOWED_COMMANDS.values():
+    _cmd_config["prefix"] = (_cmd_config["path"],)
+    _validators = [_cmd_config["allowed_flags"].__contains__]
+    if _cmd_config.get("allow_ip_targets", False):
+        _validators.append(_is_valid_target_arg)
+    _cmd_config["validators"] = tuple(_validators)
+del _cmd_config, _validators
+
+
+def _validate_command(cmd_name: str, args: tuple) -> list:
+    """
+    Shared whitelist + argument validation for command execution (2.3.1).
 
-        # Validate all port numbers are in valid range (1-65535)
-        ports = re.findall(r"\d+", value)
-        for port in ports:
-            if int(port) < 1 or int(port) > 65535:
-                return False
+    Args:
+        cmd_name: Name of command from ALLOWED_COMMANDS
+        args: Arguments to validate
 
-        return True
+    Returns:
+        Final argv list (command path + validated arguments)
 
+    Raises:
+        SecurityError: If command not whitelisted or args invalid
+    """
     # Verify command is whitelisted
     if cmd_name not in ALLOWED_COMMANDS:
         log_error(f"[SEC] Command not whitelisted: {cmd_name} (2.3.1)", level="WARNING")
@@ -681,24 +1031,16 @@ def execute_safe_command(cmd_name: str, *args: str, timeout: int = 30) -> tuple[
         raise SecurityError(f"Command '{cmd_name}' not allowed")
 
     cmd_config = ALLOWED_COMMANDS[cmd_name]
-    cmd_path = cmd_config["path"]
-    allowed_flags = cmd_config["allowed_flags"]
-    allow_ip_targets = cmd_config.get("allow_ip_targets", False)
-
-    # Validate all arguments
-    validated_args = []
-    for arg in args:
-        # Check if it's a whitelisted flag
-        if arg in allowed_flags:
-            validated_args.append(arg)
-        # Check if IP targets are allowed and this is a valid IP
-        elif allow_ip_targets and is_valid_ip_or_cidr(arg):
-            validated_args.append(arg)
-            log_error(f"[SEC] Validated IP target: {arg} for {cmd_name}", level="DEBUG")
-        # Check if it's a valid port range (for -p argument)
-        elif allow_ip_targets and is_valid_port_range(arg):
-            validated_args.append(arg)
-            log_error(f"[SEC] Validated port range: {arg} for {cmd_name}", level="DEBUG")
+    validators = cmd_config["validators"]
+
+    # Validate all arguments against the pre-built validator chain (flag
+    # membership first, then the target validator where allowed)
+    validated_args = [None] * len(args)  # pre-sized: no append resizing
+    for idx, arg in enumerate(args):
+        for validator in validators:
+            if validator(arg):
+                validated_args[idx] = arg
+                break
         else:
             log_error(
                 f"[SEC] Argument not whitelisted: {arg} for {cmd_name} (2.3.1)", level="WARNING"
@@ -714,8 +1056,36 @@ def execute_safe_command(cmd_name: str, *args: str, timeout: int = 30) -> tuple[
             )
             raise SecurityError(f"Argument '{arg}' not allowed for '{cmd_name}'")
 
-    # Build final command
-    final_cmd = [cmd_path] + validated_args
+    # Build final command from the pre-built prefix
+    final_cmd = list(cmd_config["prefix"])
+    final_cmd.extend(validated_args)
+    return final_cmd
+
+
+def execute_safe_command(cmd_name: str, *args: str, timeout: int = 30) -> tuple[str, str, int]:
+    """
+    Execute only whitelisted commands with validated arguments (2.3.1).
+
+    Args:
+        cmd_name: Name of command from ALLOWED_COMMANDS
+        *args: Arguments to pass (must all be in allowed_flags or valid IP targets)
+        timeout: Timeout in seconds (default 30s)
+
+    Returns:
+        (stdout, stderr, returncode) tuple
+
+    Raises:
+        SecurityError: If command not whitelisted or args invalid
+
+    Security features:
+    - Whitelist approach (only approved commands allowed)
+    - Argument validation (only approved flags allowed)
+    - IP target validation (format check, no injection)
+    - Timeout protection (30 seconds default)
+    - No shell expansion (subprocess list mode)
+    """
+    final_cmd = _validate_command(cmd_name, args)
+    validated_args = final_cmd[1:]
 
     try:
         # Execute with strict resource limits (2.3.2)
@@ -759,6 +1129,66 @@ def execute_safe_command(cmd_name: str, *args: str, timeout: int = 30) -> tuple[
         return ("", str(e), 1)
 
 
+def execute_safe_command_streaming(cmd_name: str, *args: str, timeout: int = 30):
+    """
+    Stream stdout lines from a whitelisted command as they are produced (2.3.1).
+
+    Same whitelist and argument validation as execute_safe_command(), but
+    yields output line by line instead of buffering the full result. An
+    nmap scan of a /24 produces hundreds of KB; streaming keeps peak RSS
+    flat on the Pi 2 and lets parsers start before the command finishes.
+
+    Args:
+        cmd_name: Name of command from ALLOWED_COMMANDS
+        *args: Arguments to pass (must all be in allowed_flags or valid IP targets)
+        timeout: Timeout in seconds - the process is killed when it expires
+
+    Returns:
+        Generator yielding stdout lines (str)
+
+    Raises:
+        SecurityError: If command not whitelisted or args invalid (raised
+        at call time, before the generator starts)
+    """
+    final_cmd = _validate_command(cmd_name, args)
+
+    audit_log("COMMAND", {"cmd": cmd_name, "args": list(args), "status": "streaming"})
+
+    def _stream():
+        proc = subprocess.Popen(
+            final_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1,  # Line-buffered
+            text=True,
+        )
+        # Timeout enforcement without blocking the reader
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            yield from proc.stdout
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+            # Consumers may close the generator after an early match;
+            # reap the process instead of blocking in wait() until it
+            # drains a dead pipe
+            if proc.poll() is None:
+                proc.terminate()
+            returncode = proc.wait()
+            log_error(
+                f"[SEC] Streamed command finished: {cmd_name} (rc={returncode}) (2.3.1)",
+                level="INFO",
+            )
+            audit_log(
+                "COMMAND",
+                {"cmd": cmd_name, "args": list(args), "status": "done", "returncode": returncode},
+            )
+
+    return _stream()
+
+
 def run_limited_subprocess(cmd, timeout=30, max_memory_mb=256):
     """
     Run subprocess with timeout and memory limits (2.3.2).
@@ -774,42 +1204,66 @@ def run_limited_subprocess(cmd, timeout=30, max_memory_mb=256):
     Security:
         - Timeout prevents hanging processes
         - Memory limit prevents exhaustion attacks (Pi 2 has 1GB total)
-        - Kills process if limits exceeded
+        - Child runs in its own session so a timeout kills the whole
+          process group, including forked helpers that would otherwise
+          orphan and keep consuming RAM
     """
 
     def limit_memory():
-        """Set memory limit for subprocess."""
+        """Run in the child before exec: new session + heap cap."""
         try:
-            # Convert MB to bytes
+            os.setsid()  # Own process group - timeout can kill grandchildren
+            # RLIMIT_DATA caps the heap without counting untouched mmap
+            # reservations, which RLIMIT_AS misfires on (nmap/reaver mmap
+            # large ranges they never touch and get killed spuriously)
             limit_bytes = max_memory_mb * 1024 * 1024
-            resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+            resource.setrlimit(resource.RLIMIT_DATA, (limit_bytes, limit_bytes))
         except Exception:
             pass  # Ignore if resource limits not available
 
     try:
         # Note: preexec_fn only works on Unix/Linux (not Windows)
-        proc = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
             preexec_fn=limit_memory,
-            check=False,
         )
 
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Kill the entire group: SIGTERM first, SIGKILL if it lingers
+            try:
+                os.killpg(proc.pid, signal.SIGTERM)
+                proc.wait(timeout=2)
+            except (subprocess.TimeoutExpired, ProcessLookupError, PermissionError):
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except (ProcessLookupError, PermissionError):
+                    pass
+                # Reap the hard-killed child - without a wait() it stays
+                # a zombie for the life of the app, one per timed-out scan
+                try:
+                    proc.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    pass
+            log_error(
+                f"[SEC] Limited subprocess timeout: {' '.join(cmd[:2])} (2.3.2)", level="WARNING"
+            )
+            audit_log(
+                "COMMAND",
+                {"cmd": cmd[0], "args": cmd[1:], "status": "timeout", "timeout_sec": timeout},
+            )
+            return ("", f"Subprocess timeout ({timeout}s)", 124)
+
         log_error(f"[SEC] Limited subprocess completed: {' '.join(cmd[:2])} (2.3.2)", level="INFO")
         audit_log(
             "COMMAND",
             {"cmd": cmd[0], "args": cmd[1:], "status": "completed", "returncode": proc.returncode},
         )
-        return (proc.stdout, proc.stderr, proc.returncode)
-
-    except subprocess.TimeoutExpired:
-        log_error(f"[SEC] Limited subprocess timeout: {' '.join(cmd[:2])} (2.3.2)", level="WARNING")
-        audit_log(
-            "COMMAND", {"cmd": cmd[0], "args": cmd[1:], "status": "timeout", "timeout_sec": timeout}
-        )
-        return ("", f"Subprocess timeout ({timeout}s)", 124)
+        return (stdout, stderr, proc.returncode)
     except MemoryError:
         log_error("[SEC] Subprocess memory limit exceeded (2.3.2)", level="ERROR")
         audit_log(
@@ -828,6 +1282,21 @@ def run_limited_subprocess(cmd, timeout=30, max_memory_mb=256):
         return ("", str(e), 1)
 
 
+# --- THREADING & CONCURRENCY (1.3.1) ---
+# One shared worker pool for the whole module. Thread creation costs
+# milliseconds each on the Pi 2, so per-operation pools would pay the
+# spin-up repeatedly; a module-wide singleton amortizes it. Workers are
+# created lazily by the executor on first submit, so the import-time
+# construction itself is cheap. Sized to the Pi 2's 4 cores.
+_GLOBAL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dedsec-")
+atexit.register(_GLOBAL_POOL.shutdown, wait=False)
+
+
+def get_pool():
+    """Return the shared module-wide worker pool."""
+    return _GLOBAL_POOL
+
+
 # --- SUBPROCESS OPTIMIZATION (1.2.2) ---
 
 
@@ -894,7 +1363,10 @@ class ButtonState:
     """
 
     def __init__(self):
-        self.selected_buttons = {}  # {group_name: tk.Button}
+        # Weak values: a destroyed button (modal teardown, panel rebuild)
+        # drops out of the mapping automatically instead of being pinned
+        # for the rest of a long-running session
+        self.selected_buttons = weakref.WeakValueDictionary()  # {group_name: tk.Button}
         self.color_normal = "#333"
         self.color_selected = "#ccff00"
 
@@ -910,11 +1382,11 @@ class ButtonState:
             color_selected = self.color_selected
 
         # Deselect previous button in this group
-        if group_name in self.selected_buttons:
-            prev_btn = self.selected_buttons[group_name]
+        prev_btn = self.selected_buttons.get(group_name)
+        if prev_btn is not None:
             try:
                 prev_btn.config(bg=self.color_normal, relief="flat")
-            except Exception:
+            except tk.TclError:
                 pass  # Button may have been destroyed
 
         # Select new button
@@ -926,14 +1398,22 @@ class ButtonState:
 
     def deselect_all(self):
         """Reset all selected buttons."""
-        for btn in self.selected_buttons.values():
+        for btn in list(self.selected_buttons.values()):
             try:
                 btn.config(bg=self.color_normal, relief="flat", fg="#ccff00")
-            except Exception:
+            except tk.TclError:
                 pass
         self.selected_buttons.clear()
 
 
+# Resolved once: with prlimit available, run_safe applies rlimits via a
+# wrapper command instead of preexec_fn. Any preexec_fn forces CPython's
+# subprocess onto the slow fork+exec path; with it gone, Popen can use
+# posix_spawn/vfork and skip copying the parent's page tables on every
+# nmap/arpspoof launch - a real cost on the Pi 2's 1GB RAM.
+_PRLIMIT_PATH = shutil.which("prlimit")
+
+
 class ProcessManager:
     """
     Manages subprocess execution with timeouts, resource limits, and cleanup.
@@ -943,9 +1423,55 @@ class ProcessManager:
     def __init__(self, max_processes=10, timeout_seconds=30):
         self.max_processes = max_processes
         self.timeout_seconds = timeout_seconds
-        self.active_processes = []
+        # Set of live Popen handles. Each run_safe() call removes its own
+        # process when it finishes, so membership is self-maintaining and
+        # no poll()-rescan list rebuilds are needed under the lock.
+        self.active_processes = set()
         self.lock = threading.Lock()
 
+    def _drain_pipes(self, process, timeout):
+        """
+        Read the child's stdout/stderr to EOF without reader threads.
+
+        A selector multiplexes both pipes non-blockingly in the calling
+        thread, so no per-child thread pair is created and the deadline
+        is enforced directly. Raises subprocess.TimeoutExpired if the
+        child keeps the pipes open past the timeout.
+
+        Returns:
+            (stdout, stderr) decoded text tuple
+        """
+        sel = selectors.DefaultSelector()
+        buffers = {}
+        for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr)):
+            if pipe is not None:
+                os.set_blocking(pipe.fileno(), False)
+                sel.register(pipe, selectors.EVENT_READ, name)
+                buffers[name] = bytearray()
+
+        deadline = time.monotonic() + timeout
+        try:
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(process.args, timeout)
+                for key, _ in sel.select(timeout=remaining):
+                    chunk = os.read(key.fileobj.fileno(), 32768)
+                    if chunk:
+                        buffers[key.data] += chunk
+                    else:
+                        sel.unregister(key.fileobj)  # EOF on this pipe
+        finally:
+            sel.close()
+            for pipe in (process.stdout, process.stderr):
+                if pipe is not None:
+                    pipe.close()
+
+        return (
+            buffers.get("stdout", bytearray()).decode(errors="replace"),
+            buffers.get("stderr", bytearray()).decode(errors="replace"),
+        )
+
     def run_safe(self, cmd, timeout=None, capture_output=False):
         """
         Execute command with timeout and resource limits.
@@ -961,41 +1487,53 @@ class ProcessManager:
         timeout = timeout or self.timeout_seconds
 
         with self.lock:
-            # Check process limit
-            self.active_processes = [p for p in self.active_processes if p.poll() is None]
+            # Check process limit (set size is live - see __init__)
             if len(self.active_processes) >= self.max_processes:
                 log_error(f"[PROC] Process limit reached ({self.max_processes}), waiting...")
                 return None
 
+        process = None
         try:
+            # Apply resource limits via a prlimit wrapper rather than
+            # preexec_fn: 256MB virtual memory, CPU time = timeout + 5s
+            # buffer. Keeping preexec_fn None lets Popen take the
+            # posix_spawn/vfork fast path (no page-table copy per launch).
+            if _PRLIMIT_PATH:
+                run_cmd = [
+                    _PRLIMIT_PATH,
+                    f"--as={256 * 1024 * 1024}",
+                    f"--cpu={int(timeout + 5)}:{int(timeout + 10)}",
+                    "--",
+                ] + list(cmd)
+            else:
+                # prlimit missing: run unlimited rather than reintroduce
+                # the slow fork path; the wait/drain deadline still caps
+                # runaway children
+                run_cmd = cmd
 
-            def limit_resources():
-                """Set memory and process limits for child process."""
-                try:
-                    # Limit virtual memory to 256MB
-                    resource.setrlimit(resource.RLIMIT_AS, (256 * 1024 * 1024, 256 * 1024 * 1024))
-                    # Limit CPU time to timeout value + 5 seconds buffer
-                    resource.setrlimit(resource.RLIMIT_CPU, (int(timeout + 5), int(timeout + 10)))
-                except Exception as e:
-                    log_error(f"[PROC] Resource limit error: {e}")
-
-            # Create process with preexec_fn for resource limits
             process = subprocess.Popen(
-                cmd,
+                run_cmd,
                 stdout=subprocess.PIPE if capture_output else subprocess.DEVNULL,
                 stderr=subprocess.PIPE if capture_output else subprocess.DEVNULL,
-                preexec_fn=limit_resources,
-                text=True,
             )
 
             with self.lock:
-                self.active_processes.append(process)
+                self.active_processes.add(process)
 
             log_error(f"[PROC] Started: {' '.join(cmd[:3])} (PID {process.pid})")
 
             try:
-                # Wait with timeout
-                stdout, stderr = process.communicate(timeout=timeout)
+                if capture_output:
+                    # Multiplex both pipes in this thread with a selector:
+                    # communicate(timeout=...) would spawn two reader
+                    # threads per child, which adds up fast with
+                    # concurrent scans on the Pi 2's 4 cores
+                    stdout, stderr = self._drain_pipes(process, timeout)
+                    process.wait(timeout=5)
+                else:
+                    stdout, stderr = None, None
+                    process.wait(timeout=timeout)
+
                 result = subprocess.CompletedProcess(
                     args=cmd, returncode=process.returncode, stdout=stdout, stderr=stderr
                 )
@@ -1014,31 +1552,165 @@ class ProcessManager:
             log_error(f"[PROC] Execution error: {e}")
             return None
 
-        finally:
-            with self.lock:
-                self.active_processes = [p for p in self.active_processes if p.poll() is None]
+        finally:
+            # O(1) removal of this call's own process; no rescans of the
+            # other entries and no list reallocation under the lock
+            if process is not None:
+                with self.lock:
+                    self.active_processes.discard(process)
+
+    def cleanup_all(self):
+        """Kill all active processes on shutdown."""
+        with self.lock:
+            procs = list(self.active_processes)
+            self.active_processes.clear()
+        for proc in procs:
+            if proc.poll() is None:
+                log_error(f"[PROC] Killing process {proc.pid}")
+                proc.terminate()
+                try:
+                    proc.wait(timeout=2)
+                except Exception:
+                    proc.kill()
+
+    def get_active_count(self):
+        """Return current count of active processes."""
+        # len() over the set is atomic under the GIL; a read-only count
+        # doesn't need to serialize against run_safe
+        return len(self.active_processes)
+
+
+# --- SECTION 3.1.1: PORT SCANNER (NMAP) ---
+# Patterns compiled once at import: the validators below run per target in
+# a sweep, and inline re.match() calls would pay the re cache lookup (and
+# the old per-call `import re`) on every invocation.
+# Hostname: alphanumeric + hyphens, labels start/end alphanumeric, final
+# label must contain a letter (differentiates from IP-like patterns)
+_HOSTNAME_RE = re.compile(
+    r"^([a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$"
+)
+_NMAP_REPORT_IP_RE = re.compile(r"Nmap scan report for (\d+\.\d+\.\d+\.\d+)")
+# Port table lines: "22/tcp open ssh OpenSSH 7.4" (version optional)
+# [ \t]+ rather than \s+ so the match never crosses a line boundary
+_NMAP_PORT_RE = re.compile(
+    r"^(\d+/(?:tcp|udp))[ \t]+(\S+)[ \t]+(\S+)(?:[ \t]+(.*))?$", re.MULTILINE
+)
+
+
+# Memoized pure validators: scans and host enumeration re-validate the
+# same handful of targets over and over, so an LRU hit (~O(1) dict
+# lookup, a few KiB of RAM) replaces the regex/ipaddress parse on
+# repeats. Side effects like audit_log stay in the calling methods so
+# suppressed repeats still reach the dedup'd audit trail.
+@functools.lru_cache(maxsize=256)
+def _is_valid_target_pure(target):
+    """Pure IP/CIDR-or-hostname check for PortScanner targets."""
+    return is_valid_ip_or_cidr(target) or bool(_HOSTNAME_RE.match(target))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_nmap_cached(nmap_output):
+    """
+    Pure nmap-output formatter, memoized on the raw stdout.
+
+    Rescans and UI refreshes often hand over byte-identical output, so a
+    hit elides the regex pass and report assembly entirely (str hashes
+    are computed once and cached by the interpreter).
+
+    Returns:
+        (formatted_results, port_count) tuple
+    """
+    matches = _NMAP_PORT_RE.findall(nmap_output)
+
+    separator = "─" * 60
+    rows = [
+        f"{port:7} | {state.upper():5} | {service:7} | {version}"
+        for port, state, service, version in matches
+    ]
+    port_count = len(rows)
+
+    results = "\n".join(
+        ["PORT    | STATE | SERVICE | VERSION", separator]
+        + rows
+        + [separator, f"Found: {port_count} ports", ""]
+    )
+    return results, port_count
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_port_range(port_range):
+    """
+    Parse a preset range string into a tuple of ints, memoized.
+
+    Handles "a-b" spans and comma lists ("80,443,8080"). The presets
+    repeat across scans, so a hit skips the parse entirely - for the
+    1-65535 preset that is ~65k int() calls per repeat scan.
+
+    Args:
+        port_range: Range string from the modal presets
+
+    Returns:
+        Tuple of port numbers, clamped to 1-65535 (1-1000 on bad input)
+    """
+    try:
+        if "-" in port_range:
+            start, end = (int(p) for p in port_range.split("-", 1))
+            return tuple(range(max(1, start), min(end, 65535) + 1))
+        return tuple(p for p in map(int, port_range.split(",")) if 1 <= p <= 65535)
+    except ValueError:
+        return tuple(range(1, 1001))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_gateway_cached(bucket):
+    """
+    Resolve the default gateway IP, memoized per 30-second bucket.
+
+    The bucket argument exists only to act as a TTL: a new bucket value
+    misses the lru_cache and recomputes, so the route is re-read at most
+    twice a minute. Reads /proc/net/route directly (no subprocess) and
+    falls back to 'ip route show default' if the parse fails.
+
+    Returns:
+        Gateway IP string or None
+    """
+    try:
+        with open("/proc/net/route") as f:
+            next(f)  # Skip header line
+            for line in f:
+                fields = line.split()
+                # Default route: destination 0.0.0.0 with RTF_GATEWAY set;
+                # gateway field is little-endian hex
+                if len(fields) >= 4 and fields[1] == "00000000" and int(fields[3], 16) & 0x2:
+                    return str(ipaddress.IPv4Address(bytes.fromhex(fields[2])[::-1]))
+    except Exception as e:
+        log_error("[ARP] /proc/net/route parse failed: %s", "DEBUG", e)
+
+    try:
+        # Fallback: stream the route table via the whitelisted ip
+        # command and stop at the first default line - the process is
+        # terminated the moment the gateway is known instead of being
+        # drained to exit
+        for line in execute_safe_command_streaming("ip", "route", "show", "default"):
+            parts = line.split()
+            if len(parts) >= 3:
+                return parts[2]  # Usually "via 192.168.1.1" format
+    except Exception as e:
+        log_error(f"[ARP] Gateway detection failed: {str(e)}")
 
-    def cleanup_all(self):
-        """Kill all active processes on shutdown."""
-        with self.lock:
-            for proc in self.active_processes:
-                if proc.poll() is None:
-                    log_error(f"[PROC] Killing process {proc.pid}")
-                    proc.terminate()
-                    try:
-                        proc.wait(timeout=2)
-                    except Exception:
-                        proc.kill()
-            self.active_processes.clear()
+    return None
 
-    def get_active_count(self):
-        """Return current count of active processes."""
-        with self.lock:
-            self.active_processes = [p for p in self.active_processes if p.poll() is None]
-            return len(self.active_processes)
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_ipv4_pure(ip_str):
+    """Pure IPv4 address check for ARPSpoofer targets."""
+    try:
+        ipaddress.IPv4Address(ip_str)
+        return True
+    except (ValueError, TypeError):
+        return False
 
 
-# --- SECTION 3.1.1: PORT SCANNER (NMAP) ---
 class PortScanner:
     """
     Network reconnaissance tool using nmap for port scanning (3.1.1).
@@ -1063,7 +1735,10 @@ class PortScanner:
         Args:
             max_cache: Maximum number of scan results to cache
         """
-        self.cache = []  # List of (target, timestamp, results) tuples
+        # LRU cache: {target: (timestamp, results)}. OrderedDict gives O(1)
+        # lookup/insert and O(1) eviction via popitem(last=False), vs the
+        # old list of tuples which rescanned and rebuilt on every access.
+        self.cache = OrderedDict()
         self.max_cache = max_cache
         self.lock = threading.Lock()
         self.last_scan_time = 0
@@ -1079,32 +1754,12 @@ class PortScanner:
         Returns:
             Boolean: True if valid format
         """
-        import re
-
         if not target or not isinstance(target, str):
             return False
 
-        # Valid IP address with proper octet validation
-        def is_valid_ipv4(ip_str):
-            parts = ip_str.split("/")
-            ip = parts[0]
-            octets = ip.split(".")
-            if len(octets) != 4:
-                return False
-            for octet in octets:
-                if not octet.isdigit() or int(octet) > 255:
-                    return False
-            # Optional: validate CIDR prefix
-            if len(parts) == 2:
-                return parts[1].isdigit() and 0 <= int(parts[1]) <= 32
-            return len(parts) == 1
-
-        # Valid hostname: must contain at least one letter (to differentiate from IP-like patterns)
-        # Format: alphanumeric + hyphens, starts/ends with alphanumeric
-        hostname_pattern = r"^([a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$"
-
-        # Check if valid IP or hostname
-        is_valid = is_valid_ipv4(target) or bool(re.match(hostname_pattern, target))
+        # Memoized pure check (see _is_valid_target_pure); audit below
+        # stays per-call
+        is_valid = _is_valid_target_pure(target)
 
         # Audit validation attempt (2.4.2 integration)
         if is_valid:
@@ -1139,18 +1794,15 @@ class PortScanner:
             Cached results or None if not found/expired
         """
         with self.lock:
-            for cached_target, timestamp, results in self.cache:
-                if cached_target == target:
-                    age = time.time() - timestamp
-                    if age < 3600:  # Cache valid for 1 hour
-                        log_error(
-                            f"[SCAN] Cache hit for {target} (age: {int(age)}s)", level="DEBUG"
-                        )
-                        return results
-                    else:
-                        # Remove expired entry
-                        self.cache.remove((cached_target, timestamp, results))
-                        break
+            entry = self.cache.get(target)
+            if entry is not None:
+                age = time.time() - entry[0]
+                if age < 3600:  # Cache valid for 1 hour
+                    self.cache.move_to_end(target)  # Mark as recently used
+                    log_error("[SCAN] Cache hit for %s (age: %ds)", "DEBUG", target, age)
+                    return entry[1]
+                # Remove expired entry
+                del self.cache[target]
 
         return None
 
@@ -1163,19 +1815,20 @@ class PortScanner:
             results: Formatted scan results
         """
         with self.lock:
-            # Remove old entry if exists
-            self.cache = [(t, ts, r) for t, ts, r in self.cache if t != target]
+            # Insert/refresh and keep the entry at the recent end
+            self.cache[target] = (time.time(), results)
+            self.cache.move_to_end(target)
 
-            # Add new entry
-            self.cache.append((target, time.time(), results))
-
-            # Keep only last N scans
-            if len(self.cache) > self.max_cache:
-                self.cache = self.cache[-self.max_cache :]
+            # Evict least-recently-used entries beyond capacity
+            while len(self.cache) > self.max_cache:
+                self.cache.popitem(last=False)
 
             log_error(
-                f"[SCAN] Cached result for {target} (cache size: {len(self.cache)}/{self.max_cache})",
-                level="DEBUG",
+                "[SCAN] Cached result for %s (cache size: %d/%d)",
+                "DEBUG",
+                target,
+                len(self.cache),
+                self.max_cache,
             )
 
     def parse_nmap_output(self, nmap_output):
@@ -1190,39 +1843,69 @@ class PortScanner:
         Returns:
             Formatted string with scan results
         """
-        lines = nmap_output.split("\n")
-        results = "PORT    | STATE | SERVICE | VERSION\n"
-        results += "─" * 60 + "\n"
-
-        port_count = 0
-        for line in lines:
-            # Match nmap output line format: "PORT/PROTOCOL STATE SERVICE VERSION"
-            # Example: "22/tcp open ssh OpenSSH 7.4"
-            if "/tcp" in line or "/udp" in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    port = parts[0]
-                    state = parts[1]
-                    service = parts[2] if len(parts) > 2 else "unknown"
-                    version = " ".join(parts[3:]) if len(parts) > 3 else ""
-
-                    # Color code by state
-                    if "open" in state:
-                        state_color = "OPEN"
-                    elif "closed" in state:
-                        state_color = "CLOSED"
-                    else:
-                        state_color = state.upper()
-
-                    results += f"{port:7} | {state_color:5} | {service:7} | {version}\n"
-                    port_count += 1
-
-        results += "─" * 60 + "\n"
-        results += f"Found: {port_count} ports\n"
+        # Memoized single pass (see _parse_nmap_cached): identical raw
+        # output from a rescan or refresh skips the regex and assembly
+        results, port_count = _parse_nmap_cached(nmap_output)
 
         log_error(f"[SCAN] Parsed {port_count} ports from nmap output", level="INFO")
         return results
 
+    def _asyncio_connect_scan(self, target, port_range):
+        """
+        TCP connect scan driven by a single asyncio event loop (3.1.1).
+
+        Fallback for hosts without nmap. One loop keeps up to ~1024
+        probes in flight at O(1) thread cost - no per-port thread or
+        GIL contention - so the full 1-65535 preset completes in
+        ~65535/1024 batches of one 300ms connect timeout instead of a
+        serial sweep. The fan-out is sized from RLIMIT_NOFILE so the
+        loop never exhausts the Pi's default FD limit.
+
+        Args:
+            target: Validated target IP/hostname
+            port_range: "start-end" port range string
+
+        Returns:
+            Formatted scan results string
+        """
+        # Memoized parse: repeat scans of a preset reuse the tuple, and
+        # comma presets ("Common"/"Web") now work here too
+        ports = _parse_port_range(port_range)
+
+        # Connect latency dominates, so width matters more than timeout:
+        # as wide as the soft FD limit allows (headroom for the UI's own
+        # files/sockets), capped at 1024
+        try:
+            soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            fan_out = max(64, min(1024, soft_limit - 64))
+        except (ValueError, OSError):
+            fan_out = 256
+
+        async def probe(sem, port):
+            async with sem:
+                try:
+                    _, writer = await asyncio.wait_for(
+                        asyncio.open_connection(target, port), timeout=0.3
+                    )
+                    writer.close()
+                    return port
+                except (OSError, asyncio.TimeoutError):
+                    return None
+
+        async def sweep():
+            sem = asyncio.Semaphore(fan_out)
+            return await asyncio.gather(*(probe(sem, p) for p in ports))
+
+        open_ports = [p for p in asyncio.run(sweep()) if p is not None]
+
+        separator = "─" * 60
+        rows = [f"{p}/tcp".ljust(7) + " | OPEN  | ?       | ?" for p in open_ports]
+        return "\n".join(
+            ["PORT    | STATE | SERVICE | VERSION", separator]
+            + rows
+            + [separator, f"Found: {len(rows)} ports (connect scan, no nmap)", ""]
+        )
+
     def scan_target(self, target, port_range="1-1000"):
         """
         Perform port scan on target using nmap (3.1.1 + 2.3 integration).
@@ -1288,6 +1971,16 @@ class PortScanner:
                 )
 
             if returncode != 0:
+                if "No such file" in stderr or "not found" in stderr.lower():
+                    # nmap missing - fall back to the asyncio connect scan
+                    log_error("[SCAN] nmap unavailable, using connect scan", level="WARNING")
+                    audit_log(
+                        "COMMAND",
+                        {"cmd": "connect_scan", "target": target, "status": "fallback"},
+                    )
+                    formatted_results = self._asyncio_connect_scan(target, port_range)
+                    self.add_to_cache(target, formatted_results)
+                    return formatted_results
                 error_msg = f"❌ nmap failed (code {returncode}): {stderr}"
                 log_error(f"[SCAN] nmap error: {stderr}", level="WARNING")
                 audit_log(
@@ -1336,16 +2029,27 @@ class ARPSpoofer:
     - Safe termination with ARP cleanup
 
     Architecture:
-    - Uses arpspoof via whitelisted execute_safe_command()
-    - Thread-based poisoning loop (non-blocking)
+    - Launches arpspoof through the same whitelist as execute_safe_command()
+    - One watcher thread reaps all spoof processes (no thread per victim)
     - Validates all targets before attack
     - Audits all spoofing activity
     """
 
     def __init__(self):
         """Initialize ARP spoofer state."""
-        self.active_spoofs = {}  # {target: {'start_time': timestamp, 'thread': thread}}
+        self.active_spoofs = {}  # {target: {'start_time': timestamp, 'proc': Popen, ...}}
+        # self.lock guards only active_spoofs mutation (tiny critical
+        # sections); the stripes serialize start/stop per target so
+        # operations on different victims never contend with each other
+        # or with the UI thread's reads
         self.lock = threading.Lock()
+        self._stripes = tuple(threading.Lock() for _ in range(16))
+        # Single reaper for all arpspoof children, started on first spoof
+        self._watcher_started = False
+
+    def _lock_for(self, ip):
+        """Return the stripe lock serializing start/stop for one target."""
+        return self._stripes[hash(ip) & 15]
 
     def get_gateway_ip(self):
         """
@@ -1354,17 +2058,10 @@ class ARPSpoofer:
         Returns:
             Gateway IP address string or None
         """
-        try:
-            # Parse route table for default gateway
-            stdout, stderr, rc = execute_safe_command("ip", "route", "show", "default")
-            if stdout and rc == 0:
-                parts = stdout.split()
-                if len(parts) >= 3:
-                    return parts[2]  # Usually "via 192.168.1.1" format
-        except Exception as e:
-            log_error(f"[ARP] Gateway detection failed: {str(e)}")
-
-        return None
+        # Memoized with a 30s TTL (see _default_gateway_cached): the
+        # gateway is near-static, so repeated calls skip both the
+        # /proc read and any subprocess fallback
+        return _default_gateway_cached(int(time.time() // 30))
 
     def get_active_hosts(self, network="192.168.1.0/24", timeout=10):
         """
@@ -1375,7 +2072,8 @@ class ARPSpoofer:
             timeout: Scan timeout in seconds
 
         Returns:
-            List of active IP addresses or empty list on error
+            Tuple of active IP addresses, empty on error. Flat strings,
+            not per-host dicts - callers index/join them directly.
         """
         if not network or "/" not in network:
             network = "192.168.1.0/24"
@@ -1384,17 +2082,17 @@ class ARPSpoofer:
             # Audit the scan request
             audit_log("COMMAND", {"type": "arp_host_scan", "network": network, "status": "started"})
 
-            # Use nmap ping scan (-sn) to find active hosts quickly
-            stdout, stderr, rc = execute_safe_command(
-                "nmap", "-sn", "-T5", network  # Ping scan only (fast)  # Insane timing (aggressive)
-            )
-
-            if rc == 0 and stdout:
-                # Parse nmap output for IP addresses
-                import re
-
-                ip_pattern = r"Nmap scan report for (\d+\.\d+\.\d+\.\d+)"
-                ips = re.findall(ip_pattern, stdout)
+            # Use nmap ping scan (-sn) to find active hosts quickly,
+            # streaming the report lines as nmap emits them instead of
+            # buffering the whole output until exit
+            found = []
+            for line in execute_safe_command_streaming("nmap", "-sn", "-T5", network):
+                m = _NMAP_REPORT_IP_RE.search(line)
+                if m:
+                    found.append(m.group(1))
+
+            if found:
+                ips = tuple(found)
                 log_error(f"[ARP] Found {len(ips)} active hosts on {network}", level="INFO")
                 audit_log(
                     "COMMAND", {"type": "arp_host_scan", "network": network, "count": len(ips)}
@@ -1404,7 +2102,7 @@ class ARPSpoofer:
             log_error(f"[ARP] Host scan error: {str(e)}")
             audit_log("VALIDATION", {"type": "arp_scan_error", "error": str(e)[:50]})
 
-        return []
+        return ()
 
     def is_valid_ip(self, ip_str):
         """
@@ -1416,13 +2114,7 @@ class ARPSpoofer:
         Returns:
             Boolean: True if valid IPv4 format
         """
-        import re
-
-        pattern = r"^(\d{1,3}\.){3}\d{1,3}$"
-        if re.match(pattern, ip_str):
-            octets = ip_str.split(".")
-            return all(0 <= int(o) <= 255 for o in octets)
-        return False
+        return _is_valid_ipv4_pure(ip_str)
 
     def start_spoof(self, target_ip, gateway_ip, spoof_interface="eth0"):
         """
@@ -1444,22 +2136,43 @@ class ARPSpoofer:
             audit_log("VALIDATION", {"type": "arp_same_target", "value": target_ip})
             return False
 
-        with self.lock:
-            if target_ip in self.active_spoofs:
-                return False  # Already spoofing this target
-
-            # Start spoofing in background thread
-            thread = threading.Thread(
-                target=self._spoof_loop, args=(target_ip, gateway_ip, spoof_interface), daemon=True
-            )
-            thread.start()
-
-            self.active_spoofs[target_ip] = {
+        with self._lock_for(target_ip):
+            # Register before launching so the reaper can never race
+            # ahead of the insert; dict mutation itself holds self.lock
+            # only briefly
+            entry = {
                 "start_time": time.time(),
-                "thread": thread,
+                "proc": None,
                 "gateway": gateway_ip,
                 "interface": spoof_interface,
             }
+            with self.lock:
+                if target_ip in self.active_spoofs:
+                    return False  # Already spoofing this target
+                self.active_spoofs[target_ip] = entry
+
+            try:
+                # Validate through the shared whitelist, then launch the
+                # child directly in its own session. No Python thread
+                # blocks on it - the single reaper watches all spoofs, so
+                # N victims cost one thread total instead of one each.
+                validated = _validate_command(
+                    "arpspoof", ("-i", spoof_interface, "-t", target_ip, gateway_ip)
+                )
+                proc = subprocess.Popen(
+                    validated,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except Exception as e:
+                with self.lock:
+                    self.active_spoofs.pop(target_ip, None)
+                log_error(f"[ARP] Spoof launch failed ({target_ip}): {e}", level="WARNING")
+                return False
+
+            entry["proc"] = proc
+            self._ensure_watcher()
 
             # Audit the attack
             audit_log(
@@ -1475,49 +2188,50 @@ class ARPSpoofer:
             log_error(f"[ARP] Spoofing started: {target_ip} <- -> {gateway_ip}", level="INFO")
             return True
 
-    def _spoof_loop(self, target_ip, gateway_ip, interface):
-        """
-        Background loop that sends ARP spoofing packets continuously.
+    def _ensure_watcher(self):
+        """Start the shared spoof reaper thread once."""
+        with self.lock:
+            if self._watcher_started:
+                return
+            self._watcher_started = True
+        threading.Thread(target=self._watch_spoofs, name="arp-spoof-reaper", daemon=True).start()
 
-        Args:
-            target_ip: Target victim IP
-            gateway_ip: Gateway IP to spoof as
-            interface: Network interface
+    def _watch_spoofs(self):
         """
-        try:
-            # Continuous ARP poisoning
-            # Note: arpspoof runs indefinitely until killed
-            # We run it in background and monitor via timeout
-            stdout, stderr, rc = execute_safe_command(
-                "arpspoof",
-                "-i",
-                interface,  # Interface
-                "-t",
-                target_ip,  # Target
-                gateway_ip,  # IP to spoof as
-            )
+        Reap finished arpspoof processes for all victims.
 
-            if rc == 0:
-                log_error(f"[ARP] Spoof loop ended for {target_ip}", level="INFO")
-            else:
-                log_error(f"[ARP] Spoof error ({target_ip}): {stderr}", level="WARNING")
-
-        except Exception as e:
-            log_error(f"[ARP] Spoof exception ({target_ip}): {str(e)}")
-        finally:
-            with self.lock:
-                if target_ip in self.active_spoofs:
-                    del self.active_spoofs[target_ip]
+        One daemon thread polls every active child once a second; exited
+        spoofs are removed from the table and audited with their real
+        duration (the entry is read before removal, so the duration is
+        never computed against a deleted record).
+        """
+        while True:
+            time.sleep(1)
+            for victim, info in list(self.active_spoofs.items()):
+                proc = info.get("proc")
+                if proc is None or proc.poll() is None:
+                    continue
+
+                with self.lock:
+                    if self.active_spoofs.get(victim) is not info:
+                        continue  # Already removed by stop_spoof
+                    del self.active_spoofs[victim]
+
+                if proc.returncode == 0:
+                    log_error(f"[ARP] Spoof loop ended for {victim}", level="INFO")
+                else:
+                    log_error(
+                        f"[ARP] Spoof exited ({victim}, rc={proc.returncode})", level="WARNING"
+                    )
 
-            audit_log(
-                "COMMAND",
-                {
-                    "type": "arp_spoof_end",
-                    "victim": target_ip,
-                    "duration": time.time()
-                    - self.active_spoofs.get(target_ip, {}).get("start_time", 0),
-                },
-            )
+                audit_log(
+                    "COMMAND",
+                    {
+                        "type": "arp_spoof_end",
+                        "victim": victim,
+                        "duration": time.time() - info["start_time"],
+                    },
+                )
 
     def stop_spoof(self, target_ip):
         """
@@ -1529,16 +2243,28 @@ class ARPSpoofer:
         Returns:
             Boolean: True if successfully stopped
         """
-        with self.lock:
-            if target_ip not in self.active_spoofs:
-                return False
+        with self._lock_for(target_ip):
+            with self.lock:
+                spoof_info = self.active_spoofs.pop(target_ip, None)
 
-            spoof_info = self.active_spoofs[target_ip]
-            spoof_info["thread"]
+            if spoof_info is None:
+                return False
 
-            # Kill the arpspoof process (via SIGTERM on thread)
-            # Note: arpspoof must be killed via process manager
-            del self.active_spoofs[target_ip]
+            # Kill the arpspoof process group (start_new_session makes
+            # the child its own group leader)
+            proc = spoof_info.get("proc")
+            if proc is not None and proc.poll() is None:
+                try:
+                    os.killpg(proc.pid, signal.SIGTERM)
+                except Exception:
+                    proc.terminate()
+                try:
+                    proc.wait(timeout=2)
+                except Exception:
+                    try:
+                        os.killpg(proc.pid, signal.SIGKILL)
+                    except Exception:
+                        proc.kill()
 
             audit_log(
                 "COMMAND",
@@ -1554,8 +2280,9 @@ class ARPSpoofer:
 
     def stop_all_spoofs(self):
         """Stop all active spoofing attacks."""
-        with self.lock:
-            targets = list(self.active_spoofs.keys())
+        # Snapshot without a lock: list() over the dict is atomic under
+        # the GIL, and stop_spoof handles targets that already vanished
+        targets = list(self.active_spoofs.keys())
 
         for target in targets:
             self.stop_spoof(target)
@@ -1569,20 +2296,25 @@ class ARPSpoofer:
         Returns:
             List of dictionaries with spoof info
         """
-        with self.lock:
-            return [
-                {
-                    "victim": victim,
-                    "gateway": info["gateway"],
-                    "interface": info["interface"],
-                    "duration": time.time() - info["start_time"],
-                    "running": info["thread"].is_alive(),
-                }
-                for victim, info in self.active_spoofs.items()
-            ]
+        # Lock-free read over a snapshot: the UI polls this while spoofs
+        # start/stop, and a point-in-time view costs no contention
+        return [
+            {
+                "victim": victim,
+                "gateway": info["gateway"],
+                "interface": info["interface"],
+                "duration": time.time() - info["start_time"],
+                "running": bool(info["proc"] and info["proc"].poll() is None),
+            }
+            for victim, info in list(self.active_spoofs.items())
+        ]
 
 
 # --- CANVAS OBJECT POOLING ---
+# Shared default for pooled text items (same interned spec as the UI)
+_POOL_FONT = FONT_LARGE
+
+
 class CanvasObjectPool:
     """
     Pre-allocates and reuses canvas text objects to reduce garbage collection
@@ -1597,6 +2329,13 @@ class CanvasObjectPool:
         self.available = []  # Stack of available item IDs
         self.active = {}  # {item_id: {"text": str, "x": int, "y": int, ...}}
         self.utilization_peak = 0
+        # Direct Tcl dispatch: every canvas.coords/itemconfig call is a
+        # Python->Tcl transition, and the Python wrappers add argument
+        # re-marshalling on top. Caching tk.call and the widget path lets
+        # acquire/release/update issue minimal raw Tcl commands - the
+        # dominant cost of animating pooled text on the Pi 2.
+        self._tk_call = canvas.tk.call
+        self._canvas_path = str(canvas)
 
         # Pre-allocate all pool objects (invisible, off-canvas initially)
         for i in range(pool_size):
@@ -1605,21 +2344,72 @@ class CanvasObjectPool:
                 -1000,  # Off-canvas
                 text="",
                 fill=COLOR_DIM,
-                font=("monospace", 10),
+                font=_POOL_FONT,
                 tags=f"pool_text_{i}",
             )
             self.available.append(item_id)
 
-    def acquire(self, x, y, text, fill=COLOR_DIM, font=("monospace", 10)):
+        # Specialized matrix-char free list (see specialize_matrix)
+        self._matrix_free = []
+
+    def specialize_matrix(self, count, font=_POOL_FONT):
+        """
+        Pre-create a dedicated set of hidden text items for the matrix
+        rain. The effect always uses the same font and shape, so its
+        acquire/release can skip the generic pool's kwargs handling and
+        bookkeeping dict entirely - each call is a pop/append on a free
+        list plus one or two raw Tcl commands.
+        """
+        self._matrix_free = [
+            self.canvas.create_text(
+                -1000, -1000, text="", fill=COLOR_MATRIX_BRIGHT, font=font, state="hidden"
+            )
+            for _ in range(count)
+        ]
+
+    def acquire_matrix(self, x, y, char):
+        """Specialized acquire for matrix chars. Returns item_id or None."""
+        if not self._matrix_free:
+            return None
+        item_id = self._matrix_free.pop()
+        self._tk_call(self._canvas_path, "coords", item_id, x, y)
+        self._tk_call(
+            self._canvas_path,
+            "itemconfigure",
+            item_id,
+            "-text",
+            char,
+            "-fill",
+            COLOR_MATRIX_BRIGHT,
+            "-state",
+            "normal",
+        )
+        return item_id
+
+    def recolor_matrix(self, item_id, fill):
+        """Specialized fade step: one raw itemconfigure, no dict lookups."""
+        self._tk_call(self._canvas_path, "itemconfigure", item_id, "-fill", fill)
+
+    def release_matrix(self, item_id):
+        """Hide a matrix char and return it to the free list."""
+        self._tk_call(self._canvas_path, "itemconfigure", item_id, "-state", "hidden")
+        self._matrix_free.append(item_id)
+
+    def acquire(self, x, y, text, fill=COLOR_DIM, font=_POOL_FONT):
         """Acquire an object from the pool. Returns item_id or None if exhausted."""
         if not self.available:
             log_error(f"[POOL WARNING] Pool exhausted: {len(self.active)}/{self.pool_size} active")
             return None
 
         item_id = self.available.pop()
-        self.canvas.coords(item_id, x, y)
-        self.canvas.itemconfig(item_id, text=text, fill=fill, font=font)
-        self.canvas.tag_raise(item_id)
+        # Raw Tcl calls: one coords, one batched itemconfigure, one raise
+        # (pool items are created before the background image, so the
+        # raise keeps re-acquired text above it)
+        self._tk_call(self._canvas_path, "coords", item_id, x, y)
+        self._tk_call(
+            self._canvas_path, "itemconfigure", item_id, "-text", text, "-fill", fill, "-font", font
+        )
+        self._tk_call(self._canvas_path, "raise", item_id)
 
         self.active[item_id] = {"x": x, "y": y, "text": text, "fill": fill}
 
@@ -1641,8 +2431,8 @@ class CanvasObjectPool:
         if item_id not in self.active:
             return False
 
-        self.canvas.coords(item_id, -1000, -1000)  # Move off-canvas
-        self.canvas.itemconfig(item_id, text="")  # Clear text
+        self._tk_call(self._canvas_path, "coords", item_id, -1000, -1000)  # Move off-canvas
+        self._tk_call(self._canvas_path, "itemconfigure", item_id, "-text", "")  # Clear text
         self.available.append(item_id)
         del self.active[item_id]
         return True
@@ -1653,20 +2443,26 @@ class CanvasObjectPool:
             return False
 
         if x is not None or y is not None:
-            curr_x, curr_y = self.canvas.coords(item_id)
-            new_x = x if x is not None else curr_x
-            new_y = y if y is not None else curr_y
-            self.canvas.coords(item_id, new_x, new_y)
-            self.active[item_id]["x"] = new_x
-            self.active[item_id]["y"] = new_y
-
+            # Fill missing coordinates from the Python-side record instead
+            # of a canvas.coords(item_id) readback - the fetch is a full
+            # Tcl round-trip for a 2-element list we already track
+            rec = self.active[item_id]
+            new_x = x if x is not None else rec["x"]
+            new_y = y if y is not None else rec["y"]
+            self._tk_call(self._canvas_path, "coords", item_id, new_x, new_y)
+            rec["x"] = new_x
+            rec["y"] = new_y
+
+        # Batch text/fill changes into a single itemconfigure transition
+        opts = ()
         if text is not None:
-            self.canvas.itemconfig(item_id, text=text)
+            opts += ("-text", text)
             self.active[item_id]["text"] = text
-
         if fill is not None:
-            self.canvas.itemconfig(item_id, fill=fill)
+            opts += ("-fill", fill)
             self.active[item_id]["fill"] = fill
+        if opts:
+            self._tk_call(self._canvas_path, "itemconfigure", item_id, *opts)
 
         return True
 
@@ -1682,6 +2478,30 @@ class CanvasObjectPool:
 
 
 # --- IMAGE CACHING WITH LRU EVICTION (v1.1.3) ---
+# Optional C-implemented LRU (lru-dict): keeps the recency list in C,
+# which benchmarks an order of magnitude faster and leaner than pure-
+# Python bookkeeping. Falls back to OrderedDict when not installed.
+try:
+    from lru import LRU as _CLRU
+except ImportError:
+    _CLRU = None
+
+
+class _CacheEntry:
+    """
+    Slotted per-item record for ImageCache. Attribute access is faster
+    than string-keyed dict lookups and the fixed slot layout roughly
+    halves the per-entry memory footprint versus a three-key dict.
+    """
+
+    __slots__ = ("data", "timestamp", "size")
+
+    def __init__(self, data, timestamp, size):
+        self.data = data
+        self.timestamp = timestamp
+        self.size = size
+
+
 class ImageCache:
     """
     LRU image cache to avoid reprocessing images on every boot.
@@ -1696,46 +2516,70 @@ class ImageCache:
     def __init__(self, max_images=3, max_size_kb=256):
         self.max_images = max_images
         self.max_size_bytes = max_size_kb * 1024
-        self.cache = {}  # {key: {"data": bytes, "timestamp": time.time(), "size": int}}
-        self.access_order = []  # LRU tracking: most recent at end
+        # Running byte total, updated on insert/evict so size checks are
+        # O(1) instead of summing every entry inside the eviction loop
+        self._size_total = 0
+        # The cache doubles as the LRU order (least recent first). With
+        # lru-dict installed the recency list lives in C and the item
+        # count cap is enforced on insert via _on_evict; otherwise an
+        # OrderedDict provides the same O(1) move_to_end/popitem ops.
+        # Entries: {key: _CacheEntry(data, timestamp, size)}
+        if _CLRU is not None:
+            self.cache = _CLRU(max_images, callback=self._on_evict)
+        else:
+            self.cache = OrderedDict()
 
     def _get_size(self, data):
         """Estimate size of cached data in bytes."""
         if isinstance(data, bytes):
             return len(data)
         elif isinstance(data, Image.Image):
-            # Estimate based on dimensions and mode
+            # True pixel-buffer bytes: width * height * channel count
+            # (mode string length == bands, so 'P' is 1, 'RGBA' is 4)
             w, h = data.size
             channels = len(data.mode)
             return w * h * channels
-        return 0
+        # Unknown payloads previously counted as 0 bytes, letting them
+        # ride free under the size cap
+        return sys.getsizeof(data)
+
+    def _on_evict(self, key, entry):
+        """lru-dict overflow callback: keep the byte total accurate."""
+        self._size_total -= entry.size
+        log_error(f"[IMAGECACHE] Evicted LRU item: {key}")
 
     def _evict_lru(self):
         """Remove least-recently-used items until constraints met."""
-        while len(self.cache) >= self.max_images or self._total_size() > self.max_size_bytes:
-            if not self.access_order:
+        while len(self.cache) >= self.max_images or self._size_total > self.max_size_bytes:
+            if not self.cache:
                 break
-            lru_key = self.access_order.pop(0)
-            if lru_key in self.cache:
+            if _CLRU is not None:
+                lru_key, evicted = self.cache.peek_last_item()
                 del self.cache[lru_key]
-                log_error(f"[IMAGECACHE] Evicted LRU item: {lru_key}")
+            else:
+                lru_key, evicted = self.cache.popitem(last=False)
+            self._size_total -= evicted.size
+            log_error(f"[IMAGECACHE] Evicted LRU item: {lru_key}")
 
     def _total_size(self):
-        """Calculate total cache size in bytes."""
-        return sum(item.get("size", 0) for item in self.cache.values())
+        """Total cache size in bytes (maintained incrementally)."""
+        return self._size_total
 
     def get(self, key):
         """Retrieve cached image/data. Returns None if not found."""
-        if key not in self.cache:
-            return None
-
-        # Move to end (most recently used)
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
+        if _CLRU is not None:
+            if key not in self.cache:
+                return None
+            entry = self.cache[key]  # __getitem__ refreshes recency in C
+        else:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            # Move to end (most recently used)
+            self.cache.move_to_end(key)
 
-        self.cache[key]["timestamp"] = time.time()
-        return self.cache[key]["data"]
+        entry.timestamp = _now_ns()
+        return entry.data
 
     def put(self, key, data):
         """Store image/data in cache. Automatically evicts if needed."""
@@ -1748,18 +2592,37 @@ class ImageCache:
             )
             return False
 
-        # Remove old entry if exists
-        if key in self.cache:
-            self.access_order.remove(key)
-
-        # Check if we need to evict
-        while (
-            len(self.cache) >= self.max_images or (self._total_size() + size) > self.max_size_bytes
-        ):
-            self._evict_lru()
+        # Remove old entry if exists (so it counts neither toward the
+        # item limit nor the size limit below)
+        if _CLRU is not None:
+            if key in self.cache:
+                self._size_total -= self.cache[key].size
+                del self.cache[key]
+            # Enforce the byte cap here; the item-count cap is the LRU's
+            # own and fires _on_evict during the insert below
+            while len(self.cache) and (self._size_total + size) > self.max_size_bytes:
+                lru_key, evicted = self.cache.peek_last_item()
+                del self.cache[lru_key]
+                self._size_total -= evicted.size
+                log_error(f"[IMAGECACHE] Evicted LRU item: {lru_key}")
+        else:
+            old = self.cache.pop(key, None)
+            if old is not None:
+                self._size_total -= old.size
+
+            # Evict least-recently-used entries until the new item fits;
+            # guarded on a non-empty cache so an unsatisfiable size check
+            # can't spin
+            while self.cache and (
+                len(self.cache) >= self.max_images
+                or (self._size_total + size) > self.max_size_bytes
+            ):
+                lru_key, evicted = self.cache.popitem(last=False)
+                self._size_total -= evicted.size
+                log_error(f"[IMAGECACHE] Evicted LRU item: {lru_key}")
 
-        self.cache[key] = {"data": data, "timestamp": time.time(), "size": size}
-        self.access_order.append(key)
+        self.cache[key] = _CacheEntry(data, _now_ns(), size)
+        self._size_total += size
         log_error(
             f"[IMAGECACHE] Cached {key} ({size} bytes, total: {self._total_size()}/{self.max_size_bytes})"
         )
@@ -1768,7 +2631,7 @@ class ImageCache:
     def clear(self):
         """Clear entire cache."""
         self.cache.clear()
-        self.access_order.clear()
+        self._size_total = 0
 
     def stats(self):
         """Return cache statistics."""
@@ -1781,6 +2644,53 @@ class ImageCache:
         }
 
 
+class ScrollableFrame(tk.Canvas):
+    """
+    Canvas + inner Frame + scrollregion rig (3.1.2.1).
+
+    Extracted from five copy-pasted constructions across the modals.
+    The <Configure> handler reads the inner frame's requested size -
+    two O(1) lookups - instead of bbox("all"), which walks every canvas
+    item on each relayout. detach()/reattach() expose the list-rebuild
+    batching trick: with the inner frame unmapped, per-row pack calls
+    can't each trigger a canvas relayout.
+    """
+
+    def __init__(self, parent, bg="black", **kwargs):
+        super().__init__(parent, bg=bg, bd=0, highlightthickness=0, **kwargs)
+        self.inner = tk.Frame(self, bg=bg)
+        self._window_item = self.create_window((0, 0), window=self.inner, anchor="nw")
+        self.inner.bind("<Configure>", self._on_inner_configure)
+
+    def _on_inner_configure(self, event):
+        self.configure(
+            scrollregion=(0, 0, self.inner.winfo_reqwidth(), self.inner.winfo_reqheight())
+        )
+
+    def detach(self):
+        """Unmap the inner frame so a rebuild costs no relayouts."""
+        self.delete(self._window_item)
+
+    def reattach(self):
+        """Remap the inner frame - exactly one layout and paint pass."""
+        self._window_item = self.create_window((0, 0), window=self.inner, anchor="nw")
+
+
+# Bound method shared by every spoof-row render - no per-row f-string
+# machinery, just one straight format call
+_SPOOF_DUR = "{}s".format
+
+
+def _preset_press(event):
+    """Darken a preset button on press (shared handler, bound once)."""
+    event.widget.configure(bg="#555", relief="sunken")
+
+
+def _preset_release(event):
+    """Restore a preset button on release (shared handler, bound once)."""
+    event.widget.configure(bg=COLOR_FG, relief="flat")
+
+
 class DedSecOS:
     def __init__(self, root):
         self.root = root
@@ -1798,6 +2708,7 @@ class DedSecOS:
 
         # --- OBJECT POOLING ---
         self.pool = CanvasObjectPool(self.canvas, pool_size=50)
+        self.pool.specialize_matrix(MAX_MATRIX_CHARS)
 
         # --- IMAGE CACHING (v1.1.3) ---
         self.image_cache = ImageCache(max_images=3, max_size_kb=256)
@@ -1806,9 +2717,13 @@ class DedSecOS:
         self.process_manager = ProcessManager(max_processes=10, timeout_seconds=30)
 
         # --- THREADING & CONCURRENCY (1.3.1) ---
-        self.thread_pool = ThreadPoolExecutor(max_workers=2)
-        self.active_futures = []  # Track active futures for cleanup
-        self.lock = threading.Lock()
+        # Shared module-wide pool - see get_pool(); avoids a second
+        # executor's thread spin-up cost
+        self.thread_pool = get_pool()
+        # Active futures for cleanup. deque append/popleft are atomic
+        # under the GIL, so no mutex is needed just to guard the
+        # container - every modal open/close used to take a Lock for it
+        self.active_futures = deque()
 
         # --- NETWORK RECONNAISSANCE TOOLS (Phase 3) ---
         self.port_scanner = PortScanner()  # 3.1.1
@@ -1821,27 +2736,68 @@ class DedSecOS:
         # --- STATE ---
         self.bg_image = None
         self.glass_image = None
-        self.matrix_chars = []
-        self.log_lines = []
-        self.terminal_pool_items = []  # Track pooled text objects for terminal
+        # Matrix chars as parallel arrays (SoA) - one contiguous int array
+        # of canvas ids plus one byte array of fade steps, compacted by
+        # swap-pop, instead of a list of per-char dicts
+        self._mc_ids = array("i")
+        self._mc_steps = array("b")
+
+        # Precomputed random streams for the animation hot paths: one
+        # cheap index bump per tick instead of 4-6 Mersenne Twister
+        # calls. The cycle lengths are long enough to look random.
+        self._rand_chars = tuple(random.choices(MATRIX_GLYPHS, k=4096))
+        self._rand_pos = tuple(
+            (random.randint(60, 320), random.randint(25, 200)) for _ in range(4096)
+        )
+        glitch_colors = (COLOR_FG, COLOR_WHITE, COLOR_ALERT, COLOR_CYAN)
+        # ~30% of glitch ticks fire; None means "show the clean logo"
+        self._rand_glitch = tuple(
+            (
+                random.choice(GLITCH_TEXTS),
+                random.choice(glitch_colors),
+                random.randint(-2, 2),
+                random.randint(-2, 2),
+            )
+            if random.random() > 0.7
+            else None
+            for _ in range(1024)
+        )
+        self._rand_i = 0
+
+        # Ring buffer: scrollback is bounded so redraws and memory stay
+        # flat across a session
+        self.log_lines = deque(maxlen=500)
 
         # Scrolling
         self.scroll_x = 0
         self.scroll_y = 0
         self.drag_start_y = 0
+        # Scrollbar geometry only changes when the log or the vertical
+        # offset does - redraws in between skip the recompute
+        self._scrollbar_dirty = True
+        # Drag redraws are coalesced to one per idle cycle (_request_redraw)
+        self._draw_pending = False
+        # Active-spoof list redraws are gated at 5 Hz - bursts of refresh
+        # requests coalesce into one deferred rebuild
+        self._last_active_refresh = 0.0
+        self._active_refresh_scheduled = False
+        # Log/status emissions are queued and flushed in one idle
+        # callback (_ui_emit/_ui_flush): K mutations, one redraw
+        self._ui_queue = deque()
+        self._ui_flush_scheduled = False
 
         # Modal State
         self.active_modal = None
 
         # Network
         self.last_net_io = psutil.net_io_counters()
-        self.last_net_time = time.time()
+        self.last_net_time = _now_ns()
         self.target_bssid = ""
         self.target_chan = ""
-        self.id_net_icon_group = []
+        self._net_icon_state = None  # (conn_type, quality bucket) of last draw
 
         # --- EVENT-DRIVEN NETWORK STATS (1.3.2) ---
-        self.last_net_update_time = time.time()
+        self.last_net_update_time = _now_ns()
         self.net_stats_interval = 1000  # Start at 1 second
         self.net_stats_no_change_count = 0  # Track consecutive polls with no change
         self.cached_net_io = self.last_net_io  # Cache for comparison
@@ -1857,8 +2813,22 @@ class DedSecOS:
         self.term_height = self.term_bottom - self.term_top  # 170px usable height
         self.line_height = 12
 
+        # Fixed pool of (bg_rect, text) pairs reused by draw_terminal()
+        # every frame instead of create/delete churn. Created lazily on
+        # the first draw so z-order against the bg/glass layers is
+        # established once, not per frame.
+        self._term_slots = []  # [(bg_id, text_id), ...]
+        self._term_slot_count = (self.term_height // self.line_height) + 1
+
+        # --- SHARED MONOTONIC TICK ---
+        # One clock read per 100ms tick, shared by every after()-driven
+        # callback instead of each one re-entering the time syscall
+        # wrapper (memcached's current_time pattern)
+        self.now_ns = _now_ns()
+        self.root.after(100, self._tick)
+
         # --- POWER MANAGEMENT (1.2.1) ---
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = _now_ns()
         self.idle_threshold = 10  # seconds before entering low-power mode
         self.is_in_low_power_mode = False
         # Update intervals (in milliseconds)
@@ -1866,11 +2836,15 @@ class DedSecOS:
             "stats": 1000,  # update_system_stats
             "network": 2000,  # update_network_icon
             "clock": 1000,  # update_clock (show seconds)
+            "animate": ANIMATION_INTERVAL_MS,  # animate_background
+            "glitch": 100,  # glitch_logo
         }
         self.low_power_intervals = {
             "stats": 5000,  # Reduce to 5 seconds
             "network": 10000,  # Reduce to 10 seconds
             "clock": 60000,  # Reduce to 60 seconds (show minutes only)
+            "animate": 1000,  # Matrix rain slows to 1 FPS
+            "glitch": 2000,  # Logo glitch nearly parked
         }
         self.current_intervals = self.normal_intervals.copy()
 
@@ -1898,8 +2872,11 @@ class DedSecOS:
             self.log_line("# the sidebar menu to begin.")
             self.log_line("")
 
-            # Force initial terminal draw
+            # Force initial terminal draw; one explicit flush so the boot
+            # frame is visible immediately - every later frame is
+            # coalesced by the mainloop's own idle redraw pass
             self.draw_terminal()
+            self.canvas.update_idletasks()
 
         except Exception as e:
             log_error(f"Init Error: {e}")
@@ -1932,87 +2909,129 @@ class DedSecOS:
         3. Cache the resized result to disk for future boots
         """
         try:
-            img_path = "/home/berry/dedsec/bg.jpg"
-            cache_path = "/home/berry/dedsec/bg_320x240.cache.png"
-
             # Fast path: use pre-scaled cached version if available
             cached_pil = self.image_cache.get("bg_image")
             if cached_pil is not None:
-                self.bg_image = ImageTk.PhotoImage(cached_pil)
-                self.canvas.create_image(0, 0, image=self.bg_image, anchor="nw", tags="bg")
+                self._bg_finalize(cached_pil)
                 log_error("[BACKGROUND] Loaded from memory cache")
                 return
 
-            # Check for disk cache
-            if os.path.exists(cache_path):
-                try:
-                    pil_img = Image.open(cache_path)
-                    pil_img.load()  # Force load to detect corruption
-                    self.image_cache.put("bg_image", pil_img)
-                    self.bg_image = ImageTk.PhotoImage(pil_img)
-                    self.canvas.create_image(0, 0, image=self.bg_image, anchor="nw", tags="bg")
-                    log_error(f"[BACKGROUND] Loaded from disk cache: {cache_path}")
-                    return
-                except Exception as e:
-                    log_error(f"[BACKGROUND] Disk cache corrupted: {e}, regenerating...")
-                    os.remove(cache_path)
-
-            # Slow path: load original image, resize, and cache
-            if os.path.exists(img_path):
-                pil_img = Image.open(img_path)
-                pil_img = pil_img.resize((320, 240), Image.Resampling.LANCZOS)
-
-                # Cache in memory
+            # Slow path (disk IO, decode, LANCZOS resize, PNG encode) runs
+            # on the shared pool; only the Tk-side PhotoImage work comes
+            # back to the main thread, since Tk objects aren't thread-safe
+            self.thread_pool.submit(self._bg_worker).add_done_callback(self._bg_loaded)
+        except Exception as e:
+            log_error(f"[BACKGROUND] Load Error: {e}")
+            self.draw_grid_bg()
+
+    def _bg_worker(self):
+        """
+        Disk half of load_background - runs on a pool thread.
+
+        Returns the resized PIL image, or None if no background exists
+        (the caller falls back to the grid).
+        """
+        img_path = "/home/berry/dedsec/bg.jpg"
+        cache_path = "/home/berry/dedsec/bg_320x240.cache.png"
+
+        # Check for disk cache
+        if os.path.exists(cache_path):
+            try:
+                pil_img = Image.open(cache_path)
+                pil_img.load()  # Force load to detect corruption
                 self.image_cache.put("bg_image", pil_img)
+                log_error(f"[BACKGROUND] Loaded from disk cache: {cache_path}")
+                return pil_img
+            except Exception as e:
+                log_error(f"[BACKGROUND] Disk cache corrupted: {e}, regenerating...")
+                os.remove(cache_path)
+
+        # Load original image, resize, and cache
+        if os.path.exists(img_path):
+            pil_img = Image.open(img_path)
+            pil_img = pil_img.resize((320, 240), Image.Resampling.LANCZOS)
+
+            # Quantize to a 64-color palette: under the matrix rain and
+            # dark glass the difference is invisible, but the palettized
+            # PNG is far smaller on disk and decodes much faster on the
+            # next boot. PhotoImage handles mode 'P' directly.
+            pil_img = pil_img.convert("P", palette=Image.ADAPTIVE, colors=64)
+
+            # Cache in memory
+            self.image_cache.put("bg_image", pil_img)
+
+            # Save to disk cache for next boot
+            try:
+                pil_img.save(cache_path, "PNG", optimize=True)
+                log_error(f"[BACKGROUND] Cached to disk: {cache_path}")
+            except Exception as e:
+                log_error(f"[BACKGROUND] Failed to save disk cache: {e}")
 
-                # Save to disk cache for next boot
-                try:
-                    pil_img.save(cache_path, "PNG", optimize=True)
-                    log_error(f"[BACKGROUND] Cached to disk: {cache_path}")
-                except Exception as e:
-                    log_error(f"[BACKGROUND] Failed to save disk cache: {e}")
-
-                self.bg_image = ImageTk.PhotoImage(pil_img)
-                self.canvas.create_image(0, 0, image=self.bg_image, anchor="nw", tags="bg")
-                log_error(f"[BACKGROUND] Loaded from original: {img_path}")
-            else:
-                self.draw_grid_bg()
-                log_error("[BACKGROUND] No background image found, using grid")
+            log_error(f"[BACKGROUND] Loaded from original: {img_path}")
+            return pil_img
+
+        log_error("[BACKGROUND] No background image found, using grid")
+        return None
+
+    def _bg_loaded(self, future):
+        """Worker completion callback - marshal the result onto the Tk thread."""
+        try:
+            pil_img = future.result()
         except Exception as e:
             log_error(f"[BACKGROUND] Load Error: {e}")
-            self.draw_grid_bg()
+            pil_img = None
+        if pil_img is not None:
+            self.root.after(0, self._bg_finalize, pil_img)
+        else:
+            self.root.after(0, self.draw_grid_bg)
+
+    def _bg_finalize(self, pil_img):
+        """Tk half of load_background - must run on the main thread."""
+        self.bg_image = ImageTk.PhotoImage(pil_img)
+        self.canvas.create_image(0, 0, image=self.bg_image, anchor="nw", tags="bg")
+        # The image may arrive after the rest of the UI has been built;
+        # keep it at the bottom of the stacking order either way
+        self.canvas.tag_lower("bg")
 
     def draw_grid_bg(self):
         for i in range(0, 320, 20):
             self.canvas.create_line(i, 0, i, 240, fill="#0a0a0a", tags="bg_grid")
         for i in range(0, 240, 20):
             self.canvas.create_line(0, i, 320, i, fill="#0a0a0a", tags="bg_grid")
+        # The fallback grid arrives after setup_ui_layers has already
+        # lowered the (then-empty) tag; keep it under the UI either way
+        self.canvas.tag_lower("bg_grid")
 
     def create_glass_panel(self, x, y, w, h, alpha):
         """
-        Create glass panel with caching (v1.1.3).
+        Create glass panel as a stippled canvas rectangle (v1.1.3).
 
-        Caches generated RGBA surface to avoid regenerating on every boot.
+        The panel is a constant-color surface, so there is no need to
+        allocate a w*h*4 RGBA buffer and round-trip it through PIL and
+        ImageTk - Tk renders the same translucent look natively with a
+        stipple pattern, at zero image memory. The stipple density
+        approximates the requested alpha.
         """
-        cache_key = f"glass_{w}x{h}_{alpha}"
-
-        # Try memory cache first
-        cached_img = self.image_cache.get(cache_key)
-        if cached_img is not None:
-            self.glass_image = ImageTk.PhotoImage(cached_img)
-            self.canvas.create_image(x, y, image=self.glass_image, anchor="nw", tags="glass")
-            log_error(f"[GLASS_PANEL] Loaded from cache: {cache_key}")
-            return
-
-        # Generate new glass panel
-        img = Image.new("RGBA", (w, h), (0, 0, 0, alpha))
+        # Map alpha (0-255) onto Tk's coarse stipple levels
+        if alpha >= 192:
+            stipple = "gray75"
+        elif alpha >= 96:
+            stipple = "gray50"
+        else:
+            stipple = "gray25"
 
-        # Cache it
-        self.image_cache.put(cache_key, img)
+        self.canvas.create_rectangle(
+            x, y, x + w, y + h, fill="#000000", stipple=stipple, outline="", tags="glass"
+        )
+        self.glass_image = True  # Layer-presence flag (see animate_background)
+        log_error(f"[GLASS_PANEL] Drew stippled panel {w}x{h} (alpha={alpha})")
 
-        self.glass_image = ImageTk.PhotoImage(img)
-        self.canvas.create_image(x, y, image=self.glass_image, anchor="nw", tags="glass")
-        log_error(f"[GLASS_PANEL] Generated and cached: {cache_key}")
+    def _press_sidebar(self, tag, cmd):
+        """Flash a canvas sidebar row and run its command."""
+        rect = self._sidebar_rects[tag]
+        self.canvas.itemconfig(rect, fill=COLOR_RED)
+        self.root.after(120, lambda: self.canvas.itemconfig(rect, fill=COLOR_BG))
+        cmd()
 
     def setup_ui_layers(self):
         # Header - Spacious Grid: 30px tall with vertically centered content
@@ -2021,41 +3040,65 @@ class DedSecOS:
 
         # Vertically centered in 30px header (y=15 is center)
         self.id_logo = self.canvas.create_text(
-            10, 15, text="DEDSEC_OS", fill=COLOR_FG, anchor="w", font=("monospace", 12, "bold")
+            10, 15, text="DEDSEC_OS", fill=COLOR_FG, anchor="w", font=FONT_TITLE_B
         )
         self.id_clock = self.canvas.create_text(
-            315, 15, text="00:00:00", fill=COLOR_WHITE, anchor="e", font=("monospace", 10, "bold")
+            315, 15, text="00:00:00", fill=COLOR_WHITE, anchor="e", font=FONT_LARGE_B
         )
+        self._last_clock_text = "00:00:00"
 
-        # Sidebar - Spacious Grid: 70px wide, positioned at y=30 (below header)
-        self.frm_sidebar = tk.Frame(self.root, bg=COLOR_BG, width=70)
-        self.frm_sidebar.place(x=0, y=30, width=70, height=180)
-        self.frm_sidebar.grid_propagate(False)
+        # Network icon items are created once and recycled: update_network_icon
+        # flips fill/state with itemconfigure instead of delete+create each tick
+        self._eth_text = self.canvas.create_text(
+            235, 15, text="[<->]", fill=COLOR_FG, font=FONT_LARGE_B, state="hidden"
+        )
+        self._wifi_bars = []
+        bar_w = 3
+        gap = 2
+        start_x = 225
+        for i in range(4):
+            h = 3 + (i * 2.5)
+            x = start_x + (i * (bar_w + gap))
+            y = 21  # Aligned to 30px header
+            self._wifi_bars.append(
+                self.canvas.create_rectangle(
+                    x, y - h, x + bar_w, y, fill=COLOR_GREY, outline="", state="hidden"
+                )
+            )
 
-        def create_btn(parent, text, cmd):
-            border_frame = tk.Frame(parent, bg=COLOR_RED, padx=1, pady=1)
-            border_frame.pack(fill="x", pady=0)
-            btn = tk.Button(
-                border_frame,
-                text=text,
-                fg=COLOR_FG,
-                bg=COLOR_BG,
-                activebackground=COLOR_RED,
-                activeforeground=COLOR_WHITE,
-                bd=0,
-                font=("monospace", 9, "bold"),
+        # Sidebar - Spacious Grid: 70px wide, positioned at y=30 (below header)
+        # Drawn directly on the canvas: each row is one rectangle + one
+        # text item with a tag binding, instead of a tk.Frame/tk.Button
+        # pair per entry. Every Tk Button is a real X11 window with its
+        # own event mask and redraw path, which adds up on the Pi 2.
+        sidebar_entries = [
+            ("> SCAN", self.show_port_scan_modal),
+            ("> ARP", self.show_arp_scan_modal),
+            ("> WIFI", self.show_wifi_modal),
+            ("> BLUE", self.show_bluetooth_modal),
+            ("> PAYL", self.show_payload_modal),
+            ("> PWR", self.show_pwr_modal),
+        ]
+        self._sidebar_rects = {}
+        row_height = 180 // len(sidebar_entries)  # 30px per row
+        for i, (label, cmd) in enumerate(sidebar_entries):
+            top = 30 + i * row_height
+            tag = f"sb_{i}"
+            self._sidebar_rects[tag] = self.canvas.create_rectangle(
+                1, top + 1, 69, top + row_height - 1, fill=COLOR_BG, outline=COLOR_RED, tags=tag
+            )
+            self.canvas.create_text(
+                6,
+                top + row_height // 2,
+                text=label,
+                fill=COLOR_FG,
                 anchor="w",
-                padx=4,
-                command=cmd,
+                font=FONT_BODY_B,
+                tags=tag,
+            )
+            self.canvas.tag_bind(
+                tag, "<ButtonPress-1>", lambda e, t=tag, c=cmd: self._press_sidebar(t, c)
             )
-            btn.pack(fill="both", expand=True)
-
-        create_btn(self.frm_sidebar, "> SCAN", self.show_port_scan_modal)
-        create_btn(self.frm_sidebar, "> ARP", self.show_arp_scan_modal)
-        create_btn(self.frm_sidebar, "> WIFI", self.show_wifi_modal)
-        create_btn(self.frm_sidebar, "> BLUE", self.show_bluetooth_modal)
-        create_btn(self.frm_sidebar, "> PAYL", self.show_payload_modal)
-        create_btn(self.frm_sidebar, "> PWR", self.show_pwr_modal)
 
         # Gutter separator - 10px wide visual gap at x=70-80 (negative space)
         # Draw line at x=70 (end of sidebar) - no line needed, blank space is the gutter
@@ -2076,14 +3119,14 @@ class DedSecOS:
         # Status message area (3.1.2.1) - vertically centered in 30px footer
         # Position at y=214 for better vertical centering
         self.id_status_text = self.canvas.create_text(
-            8, 214, text="", fill=COLOR_STATUS_NORMAL, anchor="nw", font=("monospace", 7)
+            8, 214, text="", fill=COLOR_STATUS_NORMAL, anchor="nw", font=FONT_TINY
         )
         self.status_text = ""  # Store current status
 
         # System stats row - vertically centered at y=225 (middle of 30px footer)
         # CPU section (x: 4-80) - box shifted right for breathing room
         self.canvas.create_text(
-            6, 225, text="CPU:", fill=COLOR_FG, anchor="w", font=("monospace", 9, "bold")
+            6, 225, text="CPU:", fill=COLOR_FG, anchor="w", font=FONT_BODY_B
         )
         self.id_cpu_bar = self.canvas.create_rectangle(
             40, 218, 40, 232, fill=COLOR_FG, outline="", tags="cpu_bar"
@@ -2092,26 +3135,26 @@ class DedSecOS:
 
         # RAM section (x: 80-155)
         self.canvas.create_text(
-            82, 225, text="RAM:", fill=COLOR_FG, anchor="w", font=("monospace", 9, "bold")
+            82, 225, text="RAM:", fill=COLOR_FG, anchor="w", font=FONT_BODY_B
         )
         self.id_ram_text = self.canvas.create_text(
-            118, 225, text="512MB", fill=COLOR_WHITE, anchor="w", font=("monospace", 9)
+            118, 225, text="512MB", fill=COLOR_WHITE, anchor="w", font=FONT_BODY
         )
 
         # TEMP section (x: 155-240)
         self.canvas.create_text(
-            160, 225, text="TEMP:", fill=COLOR_FG, anchor="w", font=("monospace", 9, "bold")
+            160, 225, text="TEMP:", fill=COLOR_FG, anchor="w", font=FONT_BODY_B
         )
         self.id_temp_text = self.canvas.create_text(
-            205, 225, text="32°C", fill=COLOR_WHITE, anchor="w", font=("monospace", 9)
+            205, 225, text="32°C", fill=COLOR_WHITE, anchor="w", font=FONT_BODY
         )
 
         # Extended stats (x: 240-320)
         self.canvas.create_text(
-            242, 225, text="UP:", fill=COLOR_FG, anchor="w", font=("monospace", 9, "bold")
+            242, 225, text="UP:", fill=COLOR_FG, anchor="w", font=FONT_BODY_B
         )
         self.id_net_up_text = self.canvas.create_text(
-            268, 225, text="0 Kbps", fill=COLOR_WHITE, anchor="w", font=("monospace", 9)
+            268, 225, text="0 Kbps", fill=COLOR_WHITE, anchor="w", font=FONT_BODY
         )
 
         # Send background and glass to back so terminal text appears on top (3.1.2.1 fix)
@@ -2147,20 +3190,40 @@ class DedSecOS:
                 if new_y > 0:
                     new_y = 0  # Clamp Top
                 self.scroll_y = new_y
+                self._scrollbar_dirty = True
             # Horizontal scrolling
             else:
                 new_x = self.scroll_x + dx
                 if new_x > 0:
                     new_x = 0  # Clamp left
                 self.scroll_x = new_x
-            self.draw_terminal()
+            self._request_redraw()
 
         self.drag_start_y = event.y
         self.drag_start_x = event.x
 
+    def _request_redraw(self):
+        """
+        Coalesce terminal redraws: mark dirty and flush once per idle
+        cycle. A fast swipe delivers dozens of <B1-Motion> events per
+        second; this collapses each burst into a single draw_terminal.
+        """
+        if not self._draw_pending:
+            self._draw_pending = True
+            self.root.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        self._draw_pending = False
+        self.draw_terminal()
+
+    def _tick(self):
+        """Refresh the shared monotonic tick (see __init__)."""
+        self.now_ns = _now_ns()
+        self.root.after(100, self._tick)
+
     def _record_interaction(self):
         """Record user interaction and exit low-power mode if active."""
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = self.now_ns
         if self.is_in_low_power_mode:
             self.is_in_low_power_mode = False
             self.current_intervals = self.normal_intervals.copy()
@@ -2169,7 +3232,7 @@ class DedSecOS:
 
     def _check_idle_status(self):
         """Check if system is idle and adjust update intervals accordingly."""
-        idle_time = time.time() - self.last_interaction_time
+        idle_time = (self.now_ns - self.last_interaction_time) / _NS_PER_SEC
         should_be_idle = idle_time > self.idle_threshold
 
         # Transition to low-power mode
@@ -2199,140 +3262,96 @@ class DedSecOS:
             bar_y = self.term_top + (pct_scrolled * (view_h - bar_h))
         self.canvas.coords(self.id_scrollbar, 318, bar_y, 319, bar_y + bar_h)
 
-    def clear_terminal_area(self) -> None:
+    def _init_term_slots(self) -> None:
         """
-        Clear all terminal artifacts by deleting all items in the terminal region.
-        This prevents ghosting and overlapping text.
+        Pre-create the fixed pool of (bg_rect, text) pairs used by
+        draw_terminal(). Built once after the bg/glass layers exist so
+        z-order (rect behind the grid, text above the glass) is set up a
+        single time instead of on every redraw.
         """
-        # Delete all previous terminal items
-        for item_id in self.terminal_pool_items:
+        for _ in range(self._term_slot_count):
+            bg_id = self.canvas.create_rectangle(
+                0, 0, 0, 0, fill="black", outline="", state="hidden", tags="term_bg"
+            )
+            text_id = self.canvas.create_text(
+                0,
+                0,
+                text="",
+                fill=COLOR_WHITE,
+                font=FONT_BODY,
+                anchor="w",
+                state="hidden",
+            )
             try:
-                self.canvas.delete(item_id)
-            except Exception:
-                pass
-        self.terminal_pool_items.clear()
-
-        # Also clear any orphaned text items in the terminal area
-        # This catches artifacts that might have escaped the pool
-        all_items = self.canvas.find_overlapping(
-            self.term_left, self.term_top, self.term_left + 250, self.term_bottom
-        )
-        for item_id in all_items:
-            item_type = self.canvas.type(item_id)
-            if item_type == "text":
-                # Only delete if it's a terminal item (has ">" prefix or is white)
-                try:
-                    text = self.canvas.itemcget(item_id, "text")
-                    if text.startswith(">") or self.canvas.itemcget(item_id, "fill") == COLOR_WHITE:
-                        self.canvas.delete(item_id)
-                except Exception:
-                    pass
+                if self.canvas.find_withtag("bg"):
+                    self.canvas.tag_lower(bg_id, "bg")
+                    self.canvas.tag_raise(text_id, "bg")
+                if self.canvas.find_withtag("glass"):
+                    self.canvas.tag_raise(text_id, "glass")
+            except tk.TclError:
+                pass  # Tags don't exist yet during init
+            self._term_slots.append((bg_id, text_id))
 
     def draw_terminal(self) -> None:
         """
-        Render terminal text with proper background padding and artifact prevention.
+        Render terminal text into the fixed slot pool.
 
-        Improvements:
-        - Black background rectangles behind text for better contrast
-        - Proper artifact clearing before redraw
-        - Text wrapping handled by log_line()
-        - No truncation needed (wrapping handles long lines)
+        Each redraw only moves/retags the pre-created (bg_rect, text)
+        pairs via coords/itemconfigure — no per-frame create/delete
+        churn, no artifact sweep. Slots without a line this frame are
+        hidden. Text wrapping is handled by log_line().
         """
         try:
-            # Clear all previous terminal content and artifacts
-            self.clear_terminal_area()
+            if not self._term_slots:
+                self._init_term_slots()
 
             start_x = self.term_left + self.scroll_x  # Apply horizontal scroll
             start_y = self.term_top + self.scroll_y
 
-            # Safety: Ensure we have log lines to display
-            if not self.log_lines:
-                # Display placeholder with background
-                bg_id = self.canvas.create_rectangle(
-                    start_x - 2,
-                    start_y + 2,
-                    start_x + 248,
-                    start_y + 22,
-                    fill="black",
-                    outline="",
-                    tags="term_bg",
-                )
-                text_id = self.canvas.create_text(
-                    start_x + 2,
-                    start_y + 12,
-                    text="> Ready...",
-                    fill=COLOR_WHITE,
-                    font=("monospace", 9),
-                    anchor="w",
-                )
-                self.terminal_pool_items.extend([bg_id, text_id])
-
-                # Raise text above background
-                if self.canvas.find_withtag("glass"):
-                    self.canvas.tag_raise(text_id, "glass")
-                if self.canvas.find_withtag("bg"):
-                    self.canvas.tag_raise(text_id, "bg")
-                return
-
-            # Render each line with proper spacing and background
-            for i, line in enumerate(self.log_lines):
-                y_pos = start_y + (i * self.line_height)
-
-                # Only render visible lines - strict clipping at terminal boundaries
-                if self.term_top <= y_pos <= self.term_bottom - self.line_height:
-                    try:
-                        # Skip empty lines but maintain spacing
-                        if not line or line.isspace():
-                            continue
-
-                        # Create black background rectangle behind text for contrast
-                        # This prevents grid lines from interfering with readability
-                        bg_id = self.canvas.create_rectangle(
-                            start_x - 2,
-                            y_pos - 6,
-                            start_x + 248,
-                            y_pos + 8,
-                            fill="black",
-                            outline="",
-                            tags="term_bg",
-                        )
-
-                        # Create text with proper prefix
-                        # Lines are already wrapped by log_line(), no truncation needed
-                        prefix = "> " if not line.startswith("[") else ""
-                        text_id = self.canvas.create_text(
-                            start_x + 2,
-                            y_pos,
-                            text=f"{prefix}{line}",
-                            fill=COLOR_WHITE,
-                            font=("monospace", 9),
-                            anchor="w",
-                        )
-
-                        # Track both background and text items
-                        self.terminal_pool_items.extend([bg_id, text_id])
-
-                        # Ensure proper z-order: bg behind everything, text on top
-                        try:
-                            # Lower background behind grid
-                            if self.canvas.find_withtag("bg"):
-                                self.canvas.tag_lower(bg_id, "bg")
-
-                            # Raise text above grid and glass
-                            if self.canvas.find_withtag("glass"):
-                                self.canvas.tag_raise(text_id, "glass")
-                            if self.canvas.find_withtag("bg"):
-                                self.canvas.tag_raise(text_id, "bg")
-                        except Exception:
-                            pass  # Tags don't exist yet during init
-
-                    except Exception as e:
-                        log_error(f"[TERM] Line render error: {e}")
-
-            self.update_scrollbar()
-
-            # Force canvas update to prevent artifacts
-            self.canvas.update_idletasks()
+            # Placeholder until the first real line arrives
+            lines = self.log_lines if self.log_lines else ["Ready..."]
+            n_lines = len(lines)  # Cached once - bounded by the deque maxlen
+
+            slot = 0
+            n_slots = len(self._term_slots)
+            # First index whose y lands inside the terminal (ceil division;
+            # scroll_y <= 0 so start_y <= term_top). islice avoids O(n)
+            # middle-of-deque indexing - at most slot_count lines can fit
+            # in the terminal's height.
+            first = max(0, -((start_y - self.term_top) // self.line_height))
+            visible = islice(lines, first, min(n_lines, first + n_slots))
+            for i, line in enumerate(visible, start=first):
+                y_pos = start_y + (i * self.line_height)
+                if y_pos > self.term_bottom - self.line_height:
+                    break  # Below the visible region - everything after is too
+                # Skip empty lines but maintain spacing
+                if not line or line.isspace():
+                    continue
+                if slot >= n_slots:
+                    break
+
+                bg_id, text_id = self._term_slots[slot]
+                slot += 1
+
+                # Black background rectangle keeps grid lines from
+                # interfering with readability
+                self.canvas.coords(bg_id, start_x - 2, y_pos - 6, start_x + 248, y_pos + 8)
+                self.canvas.itemconfigure(bg_id, state="normal")
+
+                # Lines are already wrapped by log_line(), no truncation needed
+                prefix = "> " if not line.startswith("[") else ""
+                self.canvas.coords(text_id, start_x + 2, y_pos)
+                self.canvas.itemconfigure(text_id, text=f"{prefix}{line}", state="normal")
+
+            # Hide the slots that got no line this frame
+            for j in range(slot, n_slots):
+                bg_id, text_id = self._term_slots[j]
+                self.canvas.itemconfigure(bg_id, state="hidden")
+                self.canvas.itemconfigure(text_id, state="hidden")
+
+            if self._scrollbar_dirty:
+                self.update_scrollbar()
+                self._scrollbar_dirty = False
 
         except Exception as e:
             log_error(f"[TERM] Draw error: {e}")
@@ -2340,59 +3359,55 @@ class DedSecOS:
     def animate_background(self):
         """Animate matrix characters using brightness fading (optimized for Pi 2)."""
         try:
-            if len(self.matrix_chars) < MAX_MATRIX_CHARS:
-                x = random.randint(60, 320)
-                y = random.randint(25, 200)
-                char = random.choice(["0", "1", "X", "Ø", "µ", "¶", "§"])
-
-                # Acquire from pool with full brightness
-                item_id = self.pool.acquire(
-                    x, y, char, fill=COLOR_MATRIX_BRIGHT, font=("monospace", 10)
-                )
+            ids = self._mc_ids
+            steps = self._mc_steps
+            if len(ids) < MAX_MATRIX_CHARS:
+                self._rand_i = (self._rand_i + 1) & 4095
+                x, y = self._rand_pos[self._rand_i]
+                char = self._rand_chars[self._rand_i]
+
+                # Acquire from the specialized matrix free list (always
+                # the same font/fill shape - see specialize_matrix)
+                item_id = self.pool.acquire_matrix(x, y, char)
                 if item_id is not None:
-                    self.canvas.tag_lower(item_id)
-                    if self.glass_image:
-                        self.canvas.tag_lower(item_id, "glass")
-                    if self.bg_image:
-                        self.canvas.tag_raise(item_id, "bg")
-                    # Track with brightness step (4 levels: bright, med, dim, very_dim)
-                    self.matrix_chars.append({"id": item_id, "step": 0})
-
-            # Fade through brightness levels and remove
-            brightness_colors = [
-                COLOR_MATRIX_BRIGHT,
-                COLOR_MATRIX_MED,
-                COLOR_MATRIX_DIM,
-                COLOR_MATRIX_VERY_DIM,
-            ]
-            for item in self.matrix_chars[:]:
-                item["step"] += 1
-                if item["step"] < len(brightness_colors):
+                    # No per-char restacking: matrix items are created
+                    # during init, below the UI chrome, and the async
+                    # background lowers itself beneath them on arrival
+                    # (_bg_finalize) - the layer order never changes
+                    ids.append(item_id)
+                    steps.append(0)
+
+            # Fade through brightness levels; fully faded chars are
+            # released and compacted out by swap-pop (order is irrelevant)
+            i = 0
+            n_steps = len(MATRIX_FADE_COLORS)
+            while i < len(ids):
+                step = steps[i] + 1
+                if step < n_steps:
                     # Update color to next brightness level (no new objects created)
-                    self.pool.update(item["id"], fill=brightness_colors[item["step"]])
+                    steps[i] = step
+                    self.pool.recolor_matrix(ids[i], MATRIX_FADE_COLORS[step])
+                    i += 1
                 else:
                     # Release when fully faded
-                    self.pool.release(item["id"])
-                    self.matrix_chars.remove(item)
-
-            # Force canvas to update display (Pi 2 needs explicit refresh)
-            self.canvas.update_idletasks()
+                    self.pool.release_matrix(ids[i])
+                    ids[i] = ids[-1]
+                    steps[i] = steps[-1]
+                    ids.pop()
+                    steps.pop()
         except Exception as e:
             log_error(f"[ANIMATE_BG] Error: {e}")
 
-        # Always reschedule
-        self.root.after(ANIMATION_INTERVAL_MS, self.animate_background)
+        # Always reschedule - interval stretches in low-power mode
+        self.root.after(self.current_intervals["animate"], self.animate_background)
 
     def glitch_logo(self):
         """Glitch effect for the logo."""
         try:
-            if random.random() > 0.7:
-                glitch_text = random.choice(
-                    ["DEDSEC_OS", "D3DSEC_0S", "DEADSEC", "ERR_0x90", "SYSTEM_FAIL"]
-                )
-                color = random.choice([COLOR_FG, COLOR_WHITE, COLOR_ALERT, COLOR_CYAN])
-                offset_x = random.randint(-2, 2)
-                offset_y = random.randint(-2, 2)
+            self._rand_i = (self._rand_i + 1) & 4095
+            entry = self._rand_glitch[self._rand_i & 1023]
+            if entry is not None:
+                glitch_text, color, offset_x, offset_y = entry
                 self.canvas.coords(
                     self.id_logo, 10 + offset_x, 15 + offset_y
                 )  # y=15 for 30px header
@@ -2400,14 +3415,11 @@ class DedSecOS:
             else:
                 self.canvas.coords(self.id_logo, 10, 15)  # y=15 for 30px header
                 self.canvas.itemconfig(self.id_logo, text="DEDSEC_OS", fill=COLOR_FG)
-
-            # Force canvas to update display
-            self.canvas.update_idletasks()
         except Exception as e:
             log_error(f"[GLITCH_LOGO] Error: {e}")
 
-        # Always reschedule
-        self.root.after(100, self.glitch_logo)
+        # Always reschedule - interval stretches in low-power mode
+        self.root.after(self.current_intervals["glitch"], self.glitch_logo)
 
     def log_pool_stats(self):
         """Log pool utilization stats periodically (debug purposes)."""
@@ -2419,37 +3431,59 @@ class DedSecOS:
         self.root.after(10000, self.log_pool_stats)  # Log every 10 seconds
 
     def setup_modals(self):
+        """
+        Create the shared modal container only.
+
+        Each modal frame is a pile of Tk widgets - every Button/Frame is
+        a real X11 window - yet a typical session opens at most one of
+        them. Construction is deferred to _get_modal(), which builds the
+        named frame from the factories registered here on first open.
+        """
         self.modal_bg = tk.Frame(
             self.root, bg="black", highlightbackground=COLOR_FG, highlightthickness=1
         )
-        self.frm_payload = tk.Frame(self.modal_bg, bg="black")
-        self.frm_wifi = tk.Frame(self.modal_bg, bg="black")
-        self.frm_wifi_detail = tk.Frame(self.modal_bg, bg="black")
-        self.frm_bluetooth = tk.Frame(self.modal_bg, bg="black")
-        self.frm_pwr = tk.Frame(self.modal_bg, bg="black")
-        self.frm_port_scan = tk.Frame(self.modal_bg, bg="black")
-        self.frm_port_results = tk.Frame(self.modal_bg, bg="black")
 
+        # ARP state read by _set_arp_network/start_arp_scan
+        self.selected_network = "192.168.1.0/24"
+
+        self._modals = {}
+        self._modal_factories = {
+            "payload": self._build_payload_modal,
+            "wifi": self._build_wifi_modal,
+            "wifi_detail": self._build_wifi_detail_modal,
+            "bluetooth": self._build_bluetooth_modal,
+            "pwr": self._build_pwr_modal,
+            "port_scan": self._build_port_scan_modal,
+            "port_results": self._build_port_results_modal,
+            "arp_scan": self._build_arp_scan_modal,
+            "arp_attack": self._build_arp_attack_modal,
+            "arp_active": self._build_arp_active_modal,
+        }
+
+    def _get_modal(self, name):
+        """Return the named modal frame, building and caching it on first use."""
+        frame = self._modals.get(name)
+        if frame is None or not frame.winfo_exists():
+            frame = self._modal_factories[name]()
+            self._modals[name] = frame
+        return frame
+
+    def _build_port_results_modal(self):
         # Port results canvas (scrollable results display)
-        self.port_results_canvas = tk.Canvas(
-            self.frm_port_results, bg="black", bd=0, highlightthickness=0
-        )
-        self.port_results_text = tk.Frame(self.port_results_canvas, bg="black")
-        self.port_results_canvas.create_window((0, 0), window=self.port_results_text, anchor="nw")
+        self.frm_port_results = tk.Frame(self.modal_bg, bg="black")
+        self.port_results_canvas = ScrollableFrame(self.frm_port_results)
+        self.port_results_text = self.port_results_canvas.inner
         self.port_results_canvas.pack(side="left", fill="both", expand=True)
-        self.port_results_text.bind(
-            "<Configure>",
-            lambda e: self.port_results_canvas.configure(
-                scrollregion=self.port_results_canvas.bbox("all")
-            ),
-        )
+        return self.frm_port_results
 
+    def _build_payload_modal(self):
+        self.frm_payload = tk.Frame(self.modal_bg, bg="black")
         tk.Label(
             self.frm_payload,
             text="EXECUTE PAYLOAD?",
             bg="black",
             fg="white",
-            font=("monospace", 10),
+            font=FONT_LARGE,
         ).pack(pady=10)
         tk.Button(
             self.frm_payload,
@@ -2459,48 +3493,47 @@ class DedSecOS:
             fg="black",
             bd=0,
         ).pack(pady=5)
+        return self.frm_payload
 
-        self.wifi_canvas = tk.Canvas(self.frm_wifi, bg="black", bd=0, highlightthickness=0)
-        self.wifi_scroll = tk.Frame(self.wifi_canvas, bg="black")
-        self.wifi_canvas.create_window(
-            (0, 0), window=self.wifi_scroll, anchor="nw", tags="self.wifi_scroll"
-        )
+    def _build_wifi_modal(self):
+        self.frm_wifi = tk.Frame(self.modal_bg, bg="black")
+        self.wifi_canvas = ScrollableFrame(self.frm_wifi)
+        self.wifi_scroll = self.wifi_canvas.inner
         self.wifi_canvas.pack(side="left", fill="both", expand=True)
-        self.wifi_scroll.bind(
-            "<Configure>",
-            lambda e: self.wifi_canvas.configure(scrollregion=self.wifi_canvas.bbox("all")),
-        )
+        return self.frm_wifi
 
-        self.bt_canvas = tk.Canvas(self.frm_bluetooth, bg="black", bd=0, highlightthickness=0)
-        self.bt_scroll = tk.Frame(self.bt_canvas, bg="black")
-        self.bt_canvas.create_window(
-            (0, 0), window=self.bt_scroll, anchor="nw", tags="self.bt_scroll"
-        )
+    def _build_bluetooth_modal(self):
+        self.frm_bluetooth = tk.Frame(self.modal_bg, bg="black")
+        self.bt_canvas = ScrollableFrame(self.frm_bluetooth)
+        self.bt_scroll = self.bt_canvas.inner
         self.bt_canvas.pack(side="left", fill="both", expand=True)
-        self.bt_scroll.bind(
-            "<Configure>",
-            lambda e: self.bt_canvas.configure(scrollregion=self.bt_canvas.bbox("all")),
-        )
+        # Fixed status label plus recycled device-row Buttons (see
+        # _update_bt_ui) - refreshes never destroy widgets
+        self.lbl_bt_status = tk.Label(self.bt_scroll, bg="black", fg="white", font=FONT_LARGE)
+        self._bt_btn_pool = []
+        return self.frm_bluetooth
 
+    def _build_wifi_detail_modal(self):
+        self.frm_wifi_detail = tk.Frame(self.modal_bg, bg="black")
         self.lbl_detail_ssid = tk.Label(
-            self.frm_wifi_detail, text="", bg="black", fg=COLOR_FG, font=("monospace", 10, "bold")
+            self.frm_wifi_detail, text="", bg="black", fg=COLOR_FG, font=FONT_LARGE_B
         )
         self.lbl_detail_ssid.pack(anchor="w", padx=5, pady=2)
         self.lbl_detail_bssid = tk.Label(
-            self.frm_wifi_detail, text="", bg="black", fg="white", font=("monospace", 9)
+            self.frm_wifi_detail, text="", bg="black", fg="white", font=FONT_BODY
         )
         self.lbl_detail_bssid.pack(anchor="w", padx=5)
         tk.Frame(self.frm_wifi_detail, bg="#333", height=1).pack(fill="x", padx=5, pady=5)
         self.lbl_detail_sec = tk.Label(
-            self.frm_wifi_detail, text="", bg="black", fg="white", font=("monospace", 9)
+            self.frm_wifi_detail, text="", bg="black", fg="white", font=FONT_BODY
         )
         self.lbl_detail_sec.pack(anchor="w", padx=5)
         self.lbl_detail_sig = tk.Label(
-            self.frm_wifi_detail, text="", bg="black", fg="white", font=("monospace", 9)
+            self.frm_wifi_detail, text="", bg="black", fg="white", font=FONT_BODY
         )
         self.lbl_detail_sig.pack(anchor="w", padx=5)
         self.lbl_detail_chan = tk.Label(
-            self.frm_wifi_detail, text="", bg="black", fg="white", font=("monospace", 9)
+            self.frm_wifi_detail, text="", bg="black", fg="white", font=FONT_BODY
         )
         self.lbl_detail_chan.pack(anchor="w", padx=5)
 
@@ -2517,86 +3550,67 @@ class DedSecOS:
             self.frm_wifi_detail,
             text="< BACK",
             command=self.show_wifi_modal,
-            bg="#333",
-            fg="white",
-            bd=0,
+            **BTN_STYLE_DARK,
             width=20,
         ).pack(side="bottom", pady=5)
+        return self.frm_wifi_detail
 
+    def _build_pwr_modal(self):
+        self.frm_pwr = tk.Frame(self.modal_bg, bg="black")
         tk.Label(
             self.frm_pwr,
             text="SYSTEM POWER:",
             bg="black",
             fg=COLOR_FG,
-            font=("monospace", 10, "bold"),
+            font=FONT_LARGE_B,
         ).pack(pady=5)
         tk.Button(
             self.frm_pwr,
             text="REBOOT",
             command=self.sys_reboot,
-            bg="#333",
-            fg="white",
-            bd=0,
+            **BTN_STYLE_DARK,
             width=15,
         ).pack(pady=2)
         tk.Button(
             self.frm_pwr,
             text="SHUTDOWN",
             command=self.sys_shutdown,
-            bg="#333",
-            fg="white",
-            bd=0,
+            **BTN_STYLE_DARK,
             width=15,
         ).pack(pady=2)
+        return self.frm_pwr
 
+    def _build_port_scan_modal(self):
         # Port Scanner UI (3.1.1) - Compact layout for 320x240 screen
+        self.frm_port_scan = tk.Frame(self.modal_bg, bg="black")
         tk.Label(
             self.frm_port_scan,
             text="TARGET:",
             bg="black",
             fg=COLOR_FG,
-            font=("monospace", 8, "bold"),
+            font=FONT_SMALL_B,
         ).pack(pady=1)
 
-        # Target preset buttons - store references for highlighting (3.1.2.1)
+        # Target preset buttons - store references for highlighting
+        # (3.1.2.1). Press feedback comes from the shared _preset_press/
+        # _preset_release bindings installed once per button, not from a
+        # lambda scheduled on every click
         self.port_target_buttons = []
         targets_frame = tk.Frame(self.frm_port_scan, bg="black")
         targets_frame.pack(fill="x", padx=5, pady=1)
-        btn1 = tk.Button(
-            targets_frame,
-            text="Gateway",
-            command=lambda b=None: self._set_port_scan_target("192.168.1.1", btn1),
-            bg="#333",
-            fg=COLOR_FG,
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn1.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_target_buttons.append(btn1)
-
-        btn2 = tk.Button(
-            targets_frame,
-            text="Router",
-            command=lambda b=None: self._set_port_scan_target("192.168.0.1", btn2),
-            bg="#333",
-            fg=COLOR_FG,
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn2.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_target_buttons.append(btn2)
-
-        btn3 = tk.Button(
-            targets_frame,
-            text="Local",
-            command=lambda b=None: self._set_port_scan_target("127.0.0.1", btn3),
-            bg="#333",
-            fg=COLOR_FG,
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn3.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_target_buttons.append(btn3)
+        for text, target in (
+            ("Gateway", "192.168.1.1"),
+            ("Router", "192.168.0.1"),
+            ("Local", "127.0.0.1"),
+        ):
+            btn = tk.Button(
+                targets_frame, text=text, bg="#333", fg=COLOR_FG, bd=0, font=FONT_TINY
+            )
+            btn.configure(command=functools.partial(self._set_port_scan_target, target, btn))
+            btn.bind("<ButtonPress-1>", _preset_press)
+            btn.bind("<ButtonRelease-1>", _preset_release)
+            btn.pack(side="left", fill="both", expand=True, padx=1)
+            self.port_target_buttons.append(btn)
 
         # Port range preset buttons - compact layout
         tk.Label(
@@ -2604,85 +3618,39 @@ class DedSecOS:
             text="RANGE:",
             bg="black",
             fg=COLOR_FG,
-            font=("monospace", 8, "bold"),
+            font=FONT_SMALL_B,
         ).pack(pady=1)
 
         self.port_range_buttons = []
         ranges_frame1 = tk.Frame(self.frm_port_scan, bg="black")
         ranges_frame1.pack(fill="x", padx=5, pady=1)
-        btn_r1 = tk.Button(
-            ranges_frame1,
-            text="100",
-            command=lambda b=None: self._set_port_scan_range("1-100", btn_r1),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn_r1.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_range_buttons.append(btn_r1)
-
-        btn_r2 = tk.Button(
-            ranges_frame1,
-            text="1K",
-            command=lambda b=None: self._set_port_scan_range("1-1000", btn_r2),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn_r2.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_range_buttons.append(btn_r2)
-
-        btn_r3 = tk.Button(
-            ranges_frame1,
-            text="Common",
-            command=lambda b=None: self._set_port_scan_range(
-                "21,22,23,25,53,80,110,443,3389", btn_r3
-            ),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn_r3.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_range_buttons.append(btn_r3)
-
         # Second row of range buttons
         ranges_frame2 = tk.Frame(self.frm_port_scan, bg="black")
         ranges_frame2.pack(fill="x", padx=5, pady=1)
-        btn_r4 = tk.Button(
-            ranges_frame2,
-            text="Web",
-            command=lambda b=None: self._set_port_scan_range("80,443,8000,8080,8443", btn_r4),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn_r4.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_range_buttons.append(btn_r4)
-
-        btn_r5 = tk.Button(
-            ranges_frame2,
-            text="All",
-            command=lambda b=None: self._set_port_scan_range("1-65535", btn_r5),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        )
-        btn_r5.pack(side="left", fill="both", expand=True, padx=1)
-        self.port_range_buttons.append(btn_r5)
+        for parent, text, port_range in (
+            (ranges_frame1, "100", "1-100"),
+            (ranges_frame1, "1K", "1-1000"),
+            (ranges_frame1, "Common", "21,22,23,25,53,80,110,443,3389"),
+            (ranges_frame2, "Web", "80,443,8000,8080,8443"),
+            (ranges_frame2, "All", "1-65535"),
+        ):
+            btn = tk.Button(
+                parent, text=text, font=FONT_TINY, **BTN_STYLE_DARK
+            )
+            btn.configure(command=functools.partial(self._set_port_scan_range, port_range, btn))
+            btn.bind("<ButtonPress-1>", _preset_press)
+            btn.bind("<ButtonRelease-1>", _preset_release)
+            btn.pack(side="left", fill="both", expand=True, padx=1)
+            self.port_range_buttons.append(btn)
 
         # Current selection display - compact
         self.lbl_port_target = tk.Label(
-            self.frm_port_scan, text="T:[none]", bg="black", fg=COLOR_WARN, font=("monospace", 7)
+            self.frm_port_scan, text="T:[none]", bg="black", fg=COLOR_WARN, font=FONT_TINY
         )
         self.lbl_port_target.pack(pady=1)
 
         self.lbl_port_range = tk.Label(
-            self.frm_port_scan, text="R:[none]", bg="black", fg=COLOR_WARN, font=("monospace", 7)
+            self.frm_port_scan, text="R:[none]", bg="black", fg=COLOR_WARN, font=FONT_TINY
         )
         self.lbl_port_range.pack(pady=1)
 
@@ -2694,19 +3662,19 @@ class DedSecOS:
             bg=COLOR_FG,
             fg="black",
             bd=0,
-            font=("monospace", 8, "bold"),
+            font=FONT_SMALL_B,
         ).pack(pady=3, fill="x", padx=5)
+        return self.frm_port_scan
 
+    def _build_arp_scan_modal(self):
         # ARP Spoofer UI (3.1.2)
         self.frm_arp_scan = tk.Frame(self.modal_bg, bg="black")
-        self.frm_arp_attack = tk.Frame(self.modal_bg, bg="black")
-        self.frm_arp_active = tk.Frame(self.modal_bg, bg="black")
 
         # Header with close button
         arp_header = tk.Frame(self.frm_arp_scan, bg="black")
         arp_header.pack(fill="x", padx=2, pady=1)
         tk.Label(
-            arp_header, text="ARP SCAN", bg="black", fg=COLOR_FG, font=("monospace", 9, "bold")
+            arp_header, text="ARP SCAN", bg="black", fg=COLOR_FG, font=FONT_BODY_B
         ).pack(side="left")
         tk.Button(
             arp_header,
@@ -2715,48 +3683,30 @@ class DedSecOS:
             bg="black",
             fg=COLOR_RED,
             bd=0,
-            font=("monospace", 9, "bold"),
+            font=FONT_BODY_B,
         ).pack(side="right")
 
         tk.Label(
-            self.frm_arp_scan, text="NETWORK:", bg="black", fg=COLOR_FG, font=("monospace", 8)
+            self.frm_arp_scan, text="NETWORK:", bg="black", fg=COLOR_FG, font=FONT_SMALL
         ).pack(pady=1)
 
         # Preset network buttons - compact horizontal layout
-        self.selected_network = "192.168.1.0/24"
         networks_frame = tk.Frame(self.frm_arp_scan, bg="black")
         networks_frame.pack(fill="x", padx=3, pady=1)
 
-        tk.Button(
-            networks_frame,
-            text="192.168.1.x",
-            command=lambda: self._set_arp_network("192.168.1.0/24"),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 6),
-            width=11,
-        ).pack(side="left", padx=1)
-        tk.Button(
-            networks_frame,
-            text="192.168.0.x",
-            command=lambda: self._set_arp_network("192.168.0.0/24"),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 6),
-            width=11,
-        ).pack(side="left", padx=1)
-        tk.Button(
-            networks_frame,
-            text="10.0.0.x",
-            command=lambda: self._set_arp_network("10.0.0.0/24"),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 6),
-            width=8,
-        ).pack(side="left", padx=1)
+        for label, net, w in (
+            ("192.168.1.x", "192.168.1.0/24", 11),
+            ("192.168.0.x", "192.168.0.0/24", 11),
+            ("10.0.0.x", "10.0.0.0/24", 8),
+        ):
+            tk.Button(
+                networks_frame,
+                text=label,
+                command=functools.partial(self._set_arp_network, net),
+                **BTN_STYLE_DARK,
+                font=FONT_MICRO,
+                width=w,
+            ).pack(side="left", padx=1)
 
         # Display selected network
         self.lbl_arp_network = tk.Label(
@@ -2764,18 +3714,18 @@ class DedSecOS:
             text=f"{self.selected_network}",
             bg="black",
             fg="white",
-            font=("monospace", 7),
+            font=FONT_TINY,
         )
         self.lbl_arp_network.pack(pady=1)
 
         # Gateway detection
         gw_frame = tk.Frame(self.frm_arp_scan, bg="black")
         gw_frame.pack(fill="x", padx=3, pady=1)
-        tk.Label(gw_frame, text="GW:", bg="black", fg=COLOR_FG, font=("monospace", 7)).pack(
+        tk.Label(gw_frame, text="GW:", bg="black", fg=COLOR_FG, font=FONT_TINY).pack(
             side="left"
         )
         self.lbl_arp_gateway = tk.Label(
-            gw_frame, text="Click detect", bg="black", fg="white", font=("monospace", 7)
+            gw_frame, text="Click detect", bg="black", fg="white", font=FONT_TINY
         )
         self.lbl_arp_gateway.pack(side="left", padx=2)
 
@@ -2786,10 +3736,8 @@ class DedSecOS:
             btn_frame,
             text="[ DETECT ]",
             command=self._detect_gateway,
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
+            **BTN_STYLE_DARK,
+            font=FONT_TINY,
             width=12,
         ).pack(side="left", padx=1)
         tk.Button(
@@ -2799,37 +3747,155 @@ class DedSecOS:
             bg=COLOR_FG,
             fg="black",
             bd=0,
-            font=("monospace", 7, "bold"),
+            font=FONT_TINY_B,
             width=12,
         ).pack(side="left", padx=1)
+        return self.frm_arp_scan
 
+    def _build_arp_attack_modal(self):
         # ARP attack target selection
-        self.arp_hosts_canvas = tk.Canvas(
-            self.frm_arp_attack, bg="black", bd=0, highlightthickness=0
+        self.frm_arp_attack = tk.Frame(self.modal_bg, bg="black")
+
+        # Fixed chrome: header + back button are built once; only the
+        # host list between them changes per refresh
+        header = tk.Frame(self.frm_arp_attack, bg="black")
+        header.pack(fill="x", padx=2, pady=2)
+        self.lbl_arp_targets_count = tk.Label(
+            header, text="TARGETS (0)", bg="black", fg=COLOR_FG, font=FONT_SMALL_B
         )
-        self.arp_hosts_frame = tk.Frame(self.arp_hosts_canvas, bg="black")
-        self.arp_hosts_canvas.create_window((0, 0), window=self.arp_hosts_frame, anchor="nw")
-        self.arp_hosts_canvas.pack(side="left", fill="both", expand=True)
-        self.arp_hosts_frame.bind(
-            "<Configure>",
-            lambda e: self.arp_hosts_canvas.configure(
-                scrollregion=self.arp_hosts_canvas.bbox("all")
-            ),
+        self.lbl_arp_targets_count.pack(side="left")
+        tk.Button(
+            header,
+            text="[X]",
+            command=self.hide_modal,
+            bg="black",
+            fg=COLOR_RED,
+            bd=0,
+            font=FONT_BODY_B,
+        ).pack(side="right")
+        self._btn_arp_back = tk.Button(
+            self.frm_arp_attack,
+            text="< BACK",
+            command=self.show_arp_scan_modal,
+            **BTN_STYLE_DARK,
+            font=FONT_TINY,
         )
-
+        self._btn_arp_back.pack(pady=5, fill="x", padx=5, side="bottom")
+
+        # All host rows live in one read-only Text widget: a single
+        # insert pass costs one layout, where a Button per host costs a
+        # widget allocation and layout pass each (254 for a /24 sweep).
+        # Clicks are resolved back to a host via the 'host' tag.
+        self.arp_hosts_text = tk.Text(
+            self.frm_arp_attack,
+            bg="black",
+            fg=COLOR_FG,
+            font=FONT_TINY,
+            cursor="hand2",
+            bd=0,
+            highlightthickness=0,
+            state="disabled",
+        )
+        self.arp_hosts_text.pack(fill="both", expand=True, padx=5)
+        self.arp_hosts_text.tag_configure("host", foreground=COLOR_FG, background="#333")
+        self.arp_hosts_text.tag_bind("host", "<Button-1>", self._on_arp_host_click)
+        self._arp_hosts = []
+        return self.frm_arp_attack
+
+    def _on_arp_host_click(self, event):
+        """Resolve a tap on the host list back to the host on that line."""
+        index = self.arp_hosts_text.index(f"@{event.x},{event.y}")
+        line = int(index.split(".")[0])
+        if 1 <= line <= len(self._arp_hosts):
+            self._start_arp_spoof(self._arp_hosts[line - 1])
+
+    def _build_arp_active_modal(self):
         # Active spoofs display
-        self.arp_active_canvas = tk.Canvas(
-            self.frm_arp_active, bg="black", bd=0, highlightthickness=0
+        self.frm_arp_active = tk.Frame(self.modal_bg, bg="black")
+
+        # Fixed chrome around the spoof list
+        header = tk.Frame(self.frm_arp_active, bg="black")
+        header.pack(fill="x", padx=2, pady=2)
+        self.lbl_arp_active_count = tk.Label(
+            header, text="ACTIVE (0)", bg="black", fg=COLOR_RED, font=FONT_SMALL_B
+        )
+        self.lbl_arp_active_count.pack(side="left")
+        tk.Button(
+            header,
+            text="[X]",
+            command=self.hide_modal,
+            bg="black",
+            fg=COLOR_RED,
+            bd=0,
+            font=FONT_BODY_B,
+        ).pack(side="right")
+        self.lbl_no_spoofs = tk.Label(
+            self.frm_arp_active,
+            text="NO ACTIVE SPOOFS",
+            bg="black",
+            fg="white",
+            font=FONT_SMALL,
         )
-        self.arp_active_frame = tk.Frame(self.arp_active_canvas, bg="black")
-        self.arp_active_canvas.create_window((0, 0), window=self.arp_active_frame, anchor="nw")
-        self.arp_active_canvas.pack(side="left", fill="both", expand=True)
-        self.arp_active_frame.bind(
-            "<Configure>",
-            lambda e: self.arp_active_canvas.configure(
-                scrollregion=self.arp_active_canvas.bbox("all")
-            ),
+        self._btn_spoof_refresh = tk.Button(
+            self.frm_arp_active,
+            text="[ REFRESH ]",
+            command=self._refresh_active_spoofs,
+            **BTN_STYLE_DARK,
+            font=FONT_TINY,
+        )
+        self._btn_spoof_back = tk.Button(
+            self.frm_arp_active,
+            text="< BACK",
+            command=self.show_arp_scan_modal,
+            **BTN_STYLE_DARK,
+            font=FONT_TINY,
         )
+        self._btn_spoof_back.pack(pady=1, fill="x", padx=5, side="bottom")
+
+        # Native virtualized list for the spoof rows: the Treeview only
+        # renders visible rows, vs a Frame/Label/Button trio per spoof
+        # that Tk had to lay out individually on every resize
+        style = ttk.Style()
+        style.configure(
+            "Spoofs.Treeview",
+            background="black",
+            foreground=COLOR_RED,
+            fieldbackground="black",
+            font=FONT_TINY,
+            rowheight=14,
+        )
+        self.arp_active_tree = ttk.Treeview(
+            self.frm_arp_active,
+            columns=("victim", "duration", "status"),
+            show="headings",
+            height=6,
+            style="Spoofs.Treeview",
+        )
+        self.arp_active_tree.heading("victim", text="VICTIM")
+        self.arp_active_tree.heading("duration", text="TIME")
+        self.arp_active_tree.heading("status", text="ST")
+        self.arp_active_tree.column("victim", width=140)
+        self.arp_active_tree.column("duration", width=70)
+        self.arp_active_tree.column("status", width=30)
+        # Tapping a row stops that spoof (same tap-to-act flow as the
+        # host list)
+        self.arp_active_tree.bind("<<TreeviewSelect>>", self._on_spoof_select)
+        self.arp_active_tree.pack(fill="both", expand=True, padx=5)
+
+        # Per-row state of the last render for the diff check, plus the
+        # last values written per victim so unchanged rows skip item()
+        self._last_spoof_rows = None
+        self._spoof_vals = {}
+        return self.frm_arp_active
+
+    def _on_spoof_select(self, event):
+        """Stop the spoof for the tapped Treeview row."""
+        selection = self.arp_active_tree.selection()
+        if selection:
+            # Clearing the selection re-fires this handler with an
+            # empty tuple, which the guard above swallows
+            self.arp_active_tree.selection_remove(*selection)
+            self._stop_arp_spoof(selection[0])
 
     def show_modal_generic(self, title, content_frame, width=240, height=160, mode=None):
         self.active_modal = mode
@@ -2837,7 +3903,7 @@ class DedSecOS:
             widget.pack_forget()
         header = tk.Frame(self.modal_bg, bg="black")
         header.pack(fill="x", padx=2, pady=2)
-        tk.Label(header, text=title, bg="black", fg=COLOR_FG, font=("monospace", 9, "bold")).pack(
+        tk.Label(header, text=title, bg="black", fg=COLOR_FG, font=FONT_BODY_B).pack(
             side="left"
         )
         tk.Button(
@@ -2847,7 +3913,7 @@ class DedSecOS:
             bg="black",
             fg="red",
             bd=0,
-            font=("monospace", 9, "bold"),
+            font=FONT_BODY_B,
         ).pack(side="right")
         content_frame.pack(fill="both", expand=True, padx=2, pady=2)
         self.modal_bg.place(relx=0.5, rely=0.5, anchor="center", width=width, height=height)
@@ -2858,24 +3924,25 @@ class DedSecOS:
         try:
             for widget in self.modal_bg.winfo_children():
                 widget.pack_forget()
+            # No forced update_idletasks here - the mainloop performs the
+            # geometry pass once, on its own, after this handler returns
             frame.pack(fill="both", expand=True)
-            self.root.update_idletasks()  # Force geometry update
         except Exception as e:
             print(f"[ERROR] _show_frame: {e}", file=sys.stderr)
 
     def show_payload_modal(self):
-        self.show_modal_generic("WARNING", self.frm_payload, height=100)
+        self.show_modal_generic("WARNING", self._get_modal("payload"), height=100)
 
     def show_pwr_modal(self):
-        self.show_modal_generic("POWER_MENU", self.frm_pwr, height=120)
+        self.show_modal_generic("POWER_MENU", self._get_modal("pwr"), height=120)
 
     def hide_modal(self):
-        # Cancel active scan futures when closing modal (1.3.1)
-        with self.lock:
-            for future in self.active_futures:
-                if not future.done():
-                    future.cancel()
-            self.active_futures = [f for f in self.active_futures if f.done()]
+        # Cancel active scan futures when closing modal (1.3.1) -
+        # lock-free drain, popleft is atomic
+        while self.active_futures:
+            future = self.active_futures.popleft()
+            if not future.done():
+                future.cancel()
 
         self.active_modal = None
         self.modal_bg.place_forget()
@@ -2887,33 +3954,29 @@ class DedSecOS:
             self.menu_state.reset_selections()
             self.button_state.deselect_all()
 
+            # Build (first open only) before touching its labels
+            frame = self._get_modal("port_scan")
+
             # Update UI display
             self.lbl_port_target.config(text="Target: [not selected]", fg=COLOR_WARN)
             self.lbl_port_range.config(text="Range: [not selected]", fg=COLOR_WARN)
 
             self.modal_bg.place(x=10, y=50, width=300, height=180)
-            self._show_frame(self.frm_port_scan)
+            self._show_frame(frame)
             self.update_status("Port Scanner: select target & range", COLOR_STATUS_INFO)
         except Exception as e:
             print(f"[ERROR] show_port_scan_modal: {e}", file=sys.stderr)
 
     def show_port_results_modal(self):
         self.modal_bg.place(x=10, y=50, width=300, height=180)
-        self._show_frame(self.frm_port_results)
+        self._show_frame(self._get_modal("port_results"))
 
     def _set_port_scan_target(self, target, button_widget=None):
-        """Store selected scan target with visual feedback (3.1.2.1)."""
-        # Visual press feedback - briefly darken button
-        if button_widget:
-            button_widget.cget("bg")
-            button_widget.config(bg="#555", relief="sunken")
-            self.root.after(
-                100,
-                lambda: (
-                    button_widget.config(bg="#ccff00", relief="flat") if button_widget else None
-                ),
-            )
+        """Store selected scan target (3.1.2.1).
 
+        Press feedback is handled by the _preset_press/_preset_release
+        bindings - nothing to schedule here.
+        """
         # Store in menu state
         self.menu_state.set_selection(target=target)
 
@@ -2926,18 +3989,11 @@ class DedSecOS:
         self.update_status(f"Target: {target} - select range", COLOR_STATUS_NORMAL)
 
     def _set_port_scan_range(self, port_range, button_widget=None):
-        """Store selected port range with visual feedback (3.1.2.1)."""
-        # Visual press feedback - briefly darken button
-        if button_widget:
-            button_widget.cget("bg")
-            button_widget.config(bg="#555", relief="sunken")
-            self.root.after(
-                100,
-                lambda: (
-                    button_widget.config(bg="#ccff00", relief="flat") if button_widget else None
-                ),
-            )
+        """Store selected port range (3.1.2.1).
 
+        Press feedback is handled by the _preset_press/_preset_release
+        bindings - nothing to schedule here.
+        """
         # Store in menu state
         self.menu_state.set_selection(range_val=port_range)
 
@@ -2975,30 +4031,30 @@ class DedSecOS:
             # Perform scan
             results = self.port_scanner.scan_target(target, port_range)
 
-            # Display results in terminal with proper spacing
-            self.log_line("")  # Blank line for separation
-            self.log_line(f"[SCAN] Target: {target}")
-            self.log_line(f"[SCAN] Ports: {port_range}")
-            self.log_line("-" * 40)  # Match wrapped text width
+            # Display results in terminal with proper spacing; all lines
+            # plus the status collapse into one idle-time flush
+            self._ui_emit("log", "")  # Blank line for separation
+            self._ui_emit("log", f"[SCAN] Target: {target}")
+            self._ui_emit("log", f"[SCAN] Ports: {port_range}")
+            self._ui_emit("log", "-" * 40)  # Match wrapped text width
 
             # Process results line by line
             result_lines = results.split("\n") if isinstance(results, str) else [results]
             for line in result_lines:
                 stripped = line.strip()
                 if stripped:
-                    # Each line is auto-wrapped by log_line if needed
-                    self.log_line(stripped)
+                    self._ui_emit("log", stripped)
 
-            self.log_line("-" * 40)
-            self.log_line("")  # Blank line after scan
-            self.update_status(f"Scan complete: {target}")
+            self._ui_emit("log", "-" * 40)
+            self._ui_emit("log", "")  # Blank line after scan
+            self._ui_emit("status", f"Scan complete: {target}")
 
         except Exception as e:
             error_msg = str(e)
-            self.log_line("")  # Blank line for separation
-            self.log_line("[ERROR] Scan failed:")
-            self.log_line(error_msg)  # Auto-wrapped if long
-            self.update_status("Scan error")
+            self._ui_emit("log", "")  # Blank line for separation
+            self._ui_emit("log", "[ERROR] Scan failed:")
+            self._ui_emit("log", error_msg)
+            self._ui_emit("status", "Scan error")
             log_error(f"Port scan error: {error_msg}")
 
     def _display_port_results(self, results, target):
@@ -3010,7 +4066,7 @@ class DedSecOS:
     def show_arp_scan_modal(self):
         """Display ARP scan modal to detect gateway and scan for hosts."""
         self.modal_bg.place(x=10, y=50, width=300, height=180)
-        self._show_frame(self.frm_arp_scan)
+        self._show_frame(self._get_modal("arp_scan"))
         self.update_status("ARP Scanner ready")
 
     def _set_arp_network(self, network):
@@ -3026,18 +4082,17 @@ class DedSecOS:
 
         # Run in background
         future = self.thread_pool.submit(self._detect_gateway_task)
-        with self.lock:
-            self.active_futures.append(future)
+        self.active_futures.append(future)
 
     def _detect_gateway_task(self):
         """Background task to detect gateway."""
         gateway = self.arp_spoofer.get_gateway_ip()
         if gateway:
             self.root.after(0, lambda: self.lbl_arp_gateway.config(text=f"GW: {gateway}"))
-            self.root.after(0, lambda: self.update_status(f"Gateway: {gateway}"))
+            self._ui_emit("status", f"Gateway: {gateway}")
         else:
             self.root.after(0, lambda: self.lbl_arp_gateway.config(text="Not found"))
-            self.root.after(0, lambda: self.update_status("Gateway not found"))
+            self._ui_emit("status", "Gateway not found")
 
     def _scroll_arp_canvas(self, event, canvas):
         """Handle touch scrolling for ARP modal canvas."""
@@ -3050,13 +4105,13 @@ class DedSecOS:
     def show_arp_attack_modal(self):
         """Display targets for ARP spoofing attack."""
         self.modal_bg.place(x=10, y=50, width=300, height=180)
-        self._show_frame(self.frm_arp_attack)
+        self._show_frame(self._get_modal("arp_attack"))
         self.update_status("Select target to spoof")
 
     def show_arp_active_modal(self):
         """Display currently active spoofing attacks."""
         self.modal_bg.place(x=10, y=50, width=300, height=180)
-        self._show_frame(self.frm_arp_active)
+        self._show_frame(self._get_modal("arp_active"))
         self._refresh_active_spoofs()
 
     def start_arp_scan(self):
@@ -3068,86 +4123,54 @@ class DedSecOS:
 
         # Run scan in thread pool
         future = self.thread_pool.submit(self._perform_arp_scan_task, network)
-        with self.lock:
-            self.active_futures.append(future)
+        self.active_futures.append(future)
 
     def _perform_arp_scan_task(self, network):
         """Background task to scan for active hosts."""
         try:
-            self.root.after(0, lambda: self.log_line(f"[ARP] Scanning {network}..."))
+            self._ui_emit("log", f"[ARP] Scanning {network}...")
 
             # Get active hosts
             hosts = self.arp_spoofer.get_active_hosts(network)
 
             if not hosts:
-                self.root.after(0, lambda: self.log_line(f"[ARP] No hosts found on {network}"))
-                self.root.after(0, lambda: self.update_status("No hosts found"))
+                self._ui_emit("log", f"[ARP] No hosts found on {network}")
+                self._ui_emit("status", "No hosts found")
                 return
 
-            # Log results
-            self.root.after(0, lambda: self.log_line(f"[ARP] Found {len(hosts)} active hosts:"))
+            # The whole result set plus the status update drains in one
+            # idle flush: one terminal redraw, one status configure
+            self._ui_emit("log", f"[ARP] Found {len(hosts)} active hosts:")
             for host in hosts:
-                self.root.after(0, lambda h=host: self.log_line(f"  • {h}"))
+                self._ui_emit("log", f"  • {host}")
+            self._ui_emit("status", f"Found {len(hosts)} hosts")
 
             # Display hosts for selection
             self.root.after(0, lambda: self._display_arp_targets(hosts))
-            self.root.after(0, lambda: self.update_status(f"Found {len(hosts)} hosts"))
 
         except Exception as e:
             error_msg = str(e)
-            self.root.after(0, lambda: self.log_line(f"[ARP] Scan error: {error_msg}"))
-            self.root.after(0, lambda: self.update_status("Scan error"))
+            self._ui_emit("log", f"[ARP] Scan error: {error_msg}")
+            self._ui_emit("status", "Scan error")
             log_error(f"ARP scan error: {error_msg}")
 
     def _display_arp_targets(self, hosts):
         """Display selectable targets in ARP attack frame."""
-        # Clear previous
-        for widget in self.arp_hosts_frame.winfo_children():
-            widget.destroy()
-
-        # Header with close button
-        header = tk.Frame(self.arp_hosts_frame, bg="black")
-        header.pack(fill="x", padx=2, pady=2)
-        tk.Label(
-            header,
-            text=f"TARGETS ({len(hosts)})",
-            bg="black",
-            fg=COLOR_FG,
-            font=("monospace", 8, "bold"),
-        ).pack(side="left")
-        tk.Button(
-            header,
-            text="[X]",
-            command=self.hide_modal,
-            bg="black",
-            fg=COLOR_RED,
-            bd=0,
-            font=("monospace", 9, "bold"),
-        ).pack(side="right")
-
-        # Create compact button for each host
-        for host in hosts[:12]:  # Limit to 12 for UI space
-            btn = tk.Button(
-                self.arp_hosts_frame,
-                text=f"{host}",
-                command=lambda h=host: self._start_arp_spoof(h),
-                bg="#333",
-                fg=COLOR_FG,
-                bd=0,
-                font=("monospace", 7),
-            )
-            btn.pack(pady=1, fill="x", padx=5)
-
-        # Back button
-        tk.Button(
-            self.arp_hosts_frame,
-            text="< BACK",
-            command=self.show_arp_scan_modal,
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        ).pack(pady=5, fill="x", padx=5)
+        self._get_modal("arp_attack")
+        self.lbl_arp_targets_count.config(text=f"TARGETS ({len(hosts)})")
+
+        # One pre-composed insert into the read-only Text: O(N) in
+        # characters with a single layout pass, and the widget scrolls
+        # itself, so the full host list fits (no 12-row cap). hosts is
+        # already a flat tuple of IP strings (the SoA layout - no
+        # per-host dicts to unpack), so the whole body is one join
+        self._arp_hosts = tuple(hosts)
+        w = self.arp_hosts_text
+        w.configure(state="normal")
+        w.delete("1.0", "end")
+        if self._arp_hosts:
+            w.insert("end", "\n".join(self._arp_hosts) + "\n", ("host",))
+        w.configure(state="disabled")
 
         # Show attack modal
         self.show_arp_attack_modal()
@@ -3156,118 +4179,85 @@ class DedSecOS:
         """Start ARP spoofing against target."""
         gateway = self.arp_spoofer.get_gateway_ip()
         if not gateway:
-            self.log_line("[ARP] Gateway not detected - cannot spoof")
-            self.update_status("Gateway not detected")
+            self._ui_emit("log", "[ARP] Gateway not detected - cannot spoof")
+            self._ui_emit("status", "Gateway not detected")
             return
 
-        self.log_line(f"[ARP] Starting spoof: {target_ip} <-> {gateway}")
+        self._ui_emit("log", f"[ARP] Starting spoof: {target_ip} <-> {gateway}")
         success = self.arp_spoofer.start_spoof(target_ip, gateway, "eth0")
 
         if success:
-            self.log_line(f"[ARP] Spoofing active: {target_ip}")
-            self.update_status(f"Spoofing {target_ip}")
+            self._ui_emit("log", f"[ARP] Spoofing active: {target_ip}")
+            self._ui_emit("status", f"Spoofing {target_ip}")
             # Show active spoofs
             self.show_arp_active_modal()
         else:
-            self.log_line(f"[ARP] Failed to spoof {target_ip}")
-            self.update_status("Spoof failed")
+            self._ui_emit("log", f"[ARP] Failed to spoof {target_ip}")
+            self._ui_emit("status", "Spoof failed")
 
     def _refresh_active_spoofs(self):
-        """Refresh the display of active spoofing attacks."""
-        # Clear previous
-        for widget in self.arp_active_frame.winfo_children():
-            widget.destroy()
+        """Refresh the active-spoof display, coalescing bursts to max 5 Hz."""
+        dt = time.monotonic() - self._last_active_refresh
+        if dt < 0.2:
+            # Too soon - defer one rebuild to the end of the gate interval
+            # and drop anything else that arrives before it fires
+            if not self._active_refresh_scheduled:
+                self._active_refresh_scheduled = True
+                self.root.after(int((0.2 - dt) * 1000), self._refresh_active_spoofs_now)
+            return
+        self._refresh_active_spoofs_now()
 
-        # Header with close button
-        header = tk.Frame(self.arp_active_frame, bg="black")
-        header.pack(fill="x", padx=2, pady=2)
+    def _refresh_active_spoofs_now(self):
+        """Rebuild the display of active spoofing attacks."""
+        self._active_refresh_scheduled = False
+        self._last_active_refresh = time.monotonic()
+        self._get_modal("arp_active")
 
-        # Get active spoofs
+        # Diff against the last render: with a stable spoof set (the
+        # steady state between duration ticks) there is nothing to
+        # mutate, so skip the detach/rebuild entirely
         spoofs = self.arp_spoofer.get_active_spoofs()
-
-        tk.Label(
-            header,
-            text=f"ACTIVE ({len(spoofs)})",
-            bg="black",
-            fg=COLOR_RED,
-            font=("monospace", 8, "bold"),
-        ).pack(side="left")
-        tk.Button(
-            header,
-            text="[X]",
-            command=self.hide_modal,
-            bg="black",
-            fg=COLOR_RED,
-            bd=0,
-            font=("monospace", 9, "bold"),
-        ).pack(side="right")
-
-        if not spoofs:
-            tk.Label(
-                self.arp_active_frame,
-                text="NO ACTIVE SPOOFS",
-                bg="black",
-                fg="white",
-                font=("monospace", 8),
-            ).pack(pady=10)
-            tk.Button(
-                self.arp_active_frame,
-                text="< BACK",
-                command=self.show_arp_scan_modal,
-                bg="#333",
-                fg="white",
-                bd=0,
-                font=("monospace", 7),
-            ).pack(pady=5, fill="x", padx=5)
+        new_rows = [(s["victim"], int(s["duration"]), s["running"]) for s in spoofs]
+        if new_rows == self._last_spoof_rows:
             return
+        self._last_spoof_rows = new_rows
 
-        # Show each active spoof
-        for spoof in spoofs:
-            victim = spoof["victim"]
-            duration = int(spoof["duration"])
-            status = "●" if spoof["running"] else "○"
+        self.lbl_arp_active_count.config(text=f"ACTIVE ({len(spoofs)})")
 
-            # Info label + stop button in frame
-            spoof_frame = tk.Frame(self.arp_active_frame, bg="black")
-            spoof_frame.pack(fill="x", padx=5, pady=1)
-
-            tk.Label(
-                spoof_frame,
-                text=f"{status} {victim} ({duration}s)",
-                bg="black",
-                fg=COLOR_RED,
-                font=("monospace", 7),
-            ).pack(side="left")
-
-            tk.Button(
-                spoof_frame,
-                text="[STOP]",
-                command=lambda v=victim: self._stop_arp_spoof(v),
-                bg=COLOR_RED,
-                fg="white",
-                bd=0,
-                font=("monospace", 6),
-            ).pack(side="right")
-
-        # Refresh and back buttons
-        tk.Button(
-            self.arp_active_frame,
-            text="[ REFRESH ]",
-            command=lambda: self._refresh_active_spoofs(),
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        ).pack(pady=3, fill="x", padx=5)
-        tk.Button(
-            self.arp_active_frame,
-            text="< BACK",
-            command=self.show_arp_scan_modal,
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 7),
-        ).pack(pady=1, fill="x", padx=5)
+        # Toggle the fixed empty-state label / refresh button
+        if not spoofs:
+            self._btn_spoof_refresh.pack_forget()
+            self.lbl_no_spoofs.pack(pady=10)
+        else:
+            self.lbl_no_spoofs.pack_forget()
+            self._btn_spoof_refresh.pack(pady=3, fill="x", padx=5, side="bottom")
+
+        # Reconcile the Treeview keyed on victim: item() updates rows
+        # in place, insert/delete handle arrivals and departures; the
+        # Treeview itself only paints visible rows
+        tree = self.arp_active_tree
+        stale = set(tree.get_children())
+        for victim, duration, running in new_rows:
+            if victim in stale:
+                stale.discard(victim)
+                # Skip the item() round trip when this row's values are
+                # byte-identical to what was last written
+                if self._spoof_vals.get(victim) == (duration, running):
+                    continue
+                tree.item(
+                    victim, values=(victim, _SPOOF_DUR(duration), "●" if running else "○")
+                )
+            else:
+                tree.insert(
+                    "",
+                    "end",
+                    iid=victim,
+                    values=(victim, _SPOOF_DUR(duration), "●" if running else "○"),
+                )
+            self._spoof_vals[victim] = (duration, running)
+        for iid in stale:
+            tree.delete(iid)
+            self._spoof_vals.pop(iid, None)
 
     def _stop_arp_spoof(self, target_ip):
         """Stop ARP spoofing for specific target."""
@@ -3286,7 +4276,7 @@ class DedSecOS:
         header = tk.Frame(self.modal_bg, bg="black")
         header.pack(fill="x", padx=2, pady=2)
         tk.Label(
-            header, text="WiFi SCAN", bg="black", fg=COLOR_FG, font=("monospace", 10, "bold")
+            header, text="WiFi SCAN", bg="black", fg=COLOR_FG, font=FONT_LARGE_B
         ).pack(side="left")
         tk.Button(
             header,
@@ -3295,7 +4285,7 @@ class DedSecOS:
             bg="black",
             fg=COLOR_RED,
             bd=0,
-            font=("monospace", 9, "bold"),
+            font=FONT_BODY_B,
         ).pack(side="right")
 
         # Add visible border line
@@ -3309,7 +4299,7 @@ class DedSecOS:
 
         # Status label
         self.lbl_wifi_status = tk.Label(
-            content, text="Press SCAN to start", bg="black", fg=COLOR_FG, font=("monospace", 9)
+            content, text="Press SCAN to start", bg="black", fg=COLOR_FG, font=FONT_BODY
         )
         self.lbl_wifi_status.pack(pady=5)
 
@@ -3321,32 +4311,21 @@ class DedSecOS:
             bg=COLOR_FG,
             fg="black",
             bd=0,
-            font=("monospace", 10, "bold"),
+            font=FONT_LARGE_B,
         ).pack(pady=3, fill="x", padx=5)
 
         # Results canvas with scrollbar
-        self.wifi_results_canvas = tk.Canvas(
-            content, bg="black", bd=0, highlightthickness=0, height=100
-        )
-        self.wifi_results_frame = tk.Frame(self.wifi_results_canvas, bg="black")
-        self.wifi_results_canvas.create_window((0, 0), window=self.wifi_results_frame, anchor="nw")
+        self.wifi_results_canvas = ScrollableFrame(content, height=100)
+        self.wifi_results_frame = self.wifi_results_canvas.inner
         self.wifi_results_canvas.pack(fill="both", expand=True, padx=5, pady=5)
-        self.wifi_results_frame.bind(
-            "<Configure>",
-            lambda e: self.wifi_results_canvas.configure(
-                scrollregion=self.wifi_results_canvas.bbox("all")
-            ),
-        )
 
         # Close button
         tk.Button(
             content,
             text="[ CLOSE ]",
             command=self.hide_modal,
-            bg="#333",
-            fg="white",
-            bd=0,
-            font=("monospace", 9),
+            **BTN_STYLE_DARK,
+            font=FONT_BODY,
         ).pack(pady=3, fill="x", padx=5)
 
         # Show modal with proper positioning
@@ -3363,26 +4342,22 @@ class DedSecOS:
 
         # Submit to thread pool
         future = self.thread_pool.submit(self._scan_wifi_task)
-        with self.lock:
-            self.active_futures.append(future)
+        self.active_futures.append(future)
 
     def show_bluetooth_modal(self):
-        for widget in self.bt_scroll.winfo_children():
-            widget.destroy()
-        tk.Label(
-            self.bt_scroll,
-            text="SCANNING BLUETOOTH...",
-            bg="black",
-            fg="white",
-            font=("monospace", 10),
-        ).pack(pady=10)
+        self._get_modal("bluetooth")
+        # Hide any rows from the previous scan and show the fixed
+        # status label - no widget is destroyed
+        for btn in self._bt_btn_pool:
+            btn.pack_forget()
+        self.lbl_bt_status.config(text="SCANNING BLUETOOTH...", fg="white")
+        self.lbl_bt_status.pack(pady=10)
         self.show_modal_generic(
             "BLUETOOTH_SCAN", self.frm_bluetooth, width=260, height=180, mode="bt"
         )
         # Submit to thread pool (1.3.1)
         future = self.thread_pool.submit(self._scan_bt_task)
-        with self.lock:
-            self.active_futures.append(future)
+        self.active_futures.append(future)
 
     def _scan_bt_task(self):
         devices = []
@@ -3415,26 +4390,36 @@ class DedSecOS:
         self.root.after(0, lambda: self._update_bt_ui(devices))
 
     def _update_bt_ui(self, devices):
-        for widget in self.bt_scroll.winfo_children():
-            widget.destroy()
+        """Render scan results by recycling pooled device Buttons."""
         if not devices:
-            tk.Label(self.bt_scroll, text="NO DEVICES FOUND", bg="black", fg="red").pack(pady=10)
+            self.lbl_bt_status.config(text="NO DEVICES FOUND", fg="red")
+            self.lbl_bt_status.pack(pady=10)
             return
-        for dev in devices:
-            row = tk.Frame(self.bt_scroll, bg="black")
-            row.pack(fill="x", pady=1)
-            btn = tk.Button(
-                row,
-                text=f"{dev['name']} ({dev['mac']})",
-                anchor="w",
-                bg="#111",
-                fg=COLOR_CYAN,
-                bd=0,
-                font=("monospace", 9),
-                activebackground=COLOR_DIM,
-                activeforeground="white",
+        self.lbl_bt_status.pack_forget()
+
+        # Rebuild while detached so per-row packs don't each relayout;
+        # surplus pool rows are hidden, never destroyed
+        self.bt_canvas.detach()
+        while len(self._bt_btn_pool) < len(devices):
+            self._bt_btn_pool.append(
+                tk.Button(
+                    self.bt_scroll,
+                    anchor="w",
+                    bg="#111",
+                    fg=COLOR_CYAN,
+                    bd=0,
+                    font=FONT_BODY,
+                    activebackground=COLOR_DIM,
+                    activeforeground="white",
+                )
             )
-            btn.pack(fill="x", ipady=5)
+        for i, dev in enumerate(devices):
+            btn = self._bt_btn_pool[i]
+            btn.configure(text=f"{dev['name']} ({dev['mac']})")
+            btn.pack(fill="x", pady=1, ipady=5)
+        for i in range(len(devices), len(self._bt_btn_pool)):
+            self._bt_btn_pool[i].pack_forget()
+        self.bt_canvas.reattach()
 
     def _scan_wifi_task(self):
         networks = []
@@ -3455,28 +4440,37 @@ class DedSecOS:
             )
 
             if result and result.stdout:
-                for line in result.stdout.splitlines():
-                    # Regex split to handle escaped colons (\:)
-                    parts = re.split(r"(?<!\\):", line)
-
-                    if len(parts) >= 6:
-                        # Clean up escaped chars
-                        ssid = parts[0].replace("\\:", ":").replace("\\%", "%")
-                        if not ssid:
-                            ssid = "<HIDDEN>"
-                        # Sanitize SSID to prevent injection (2.1.1)
-                        ssid = sanitize_ssid(ssid)
-
-                        security = parts[3]
-                        icon = "⚠"
-                        if "WPA" in security or "RSN" in security:
-                            icon = "🔒"
+                # The C-implemented csv reader unescapes nmcli's \: and
+                # \\ sequences in one pass - no per-line regex split,
+                # no manual replace() cleanup afterwards. Terse output is
+                # escape-only, never quoted: QUOTE_NONE keeps a leading
+                # double-quote in an SSID from swallowing the rest of the
+                # line as one quoted field
+                reader = csv.reader(
+                    result.stdout.splitlines(),
+                    delimiter=":",
+                    escapechar="\\",
+                    quoting=csv.QUOTE_NONE,
+                )
+                for parts in reader:
+                    if len(parts) < 6:
+                        continue
+
+                    # Sanitize SSID to prevent injection (2.1.1)
+                    ssid = sanitize_ssid(parts[0] or "<HIDDEN>")
+
+                    security = parts[3]
+                    if "WPA" in security or "RSN" in security:
+                        icon = "🔒"
                     elif "WEP" in security:
                         icon = "🔓"
+                    else:
+                        icon = "⚠"
 
-                    # Validate BSSID format (2.1.1)
+                    # Validate BSSID format (2.1.1); the reader already
+                    # rejoined its escaped colons
                     try:
-                        bssid = validate_bssid(parts[1].replace("\\:", ":"))
+                        bssid = validate_bssid(parts[1])
                     except ValueError as e:
                         log_error(f"[SEC] Invalid BSSID: {e}")
                         bssid = "00:00:00:00:00:00"  # Skip invalid BSSID
@@ -3533,6 +4527,7 @@ class DedSecOS:
         self.update_status(f"WiFi scan complete: {len(networks)} networks found")
 
     def show_wifi_detail(self, net):
+        self._get_modal("wifi_detail")
         # Sanitize SSID display (2.1.1)
         display_ssid = sanitize_ssid(net["ssid"])
         self.lbl_detail_ssid.config(text=f"TARGET: {display_ssid[:18]}")
@@ -3572,8 +4567,7 @@ class DedSecOS:
     def run_nmap_thread(self):
         # Submit to thread pool (1.3.1)
         future = self.thread_pool.submit(self._run_real_nmap)
-        with self.lock:
-            self.active_futures.append(future)
+        self.active_futures.append(future)
 
     def _run_real_nmap(self):
         self.log_line("DETECTING GATEWAY...")
@@ -3637,11 +4631,13 @@ class DedSecOS:
             else:
                 now = time.strftime("%H:%M:%S")
 
-            # Verify canvas item still exists
-            if self.id_clock:
+            # Verify canvas item still exists; skip the Tcl round trip
+            # when the text hasn't changed (in low-power mode the
+            # minute string is stable for 60 ticks). No forced
+            # update_idletasks - itemconfig already queues the repaint
+            if self.id_clock and now != self._last_clock_text:
+                self._last_clock_text = now
                 self.canvas.itemconfig(self.id_clock, text=now)
-                # Force canvas to update display
-                self.canvas.update_idletasks()
 
             # Schedule next update
             self.root.after(self.current_intervals["clock"], self.update_clock)
@@ -3679,10 +4675,11 @@ class DedSecOS:
 
             # --- EVENT-DRIVEN NETWORK STATS (1.3.2) ---
             # Only update network stats if delta > 1KB or backoff expired
-            now = time.time()
+            now = self.now_ns
             time_since_update = now - self.last_net_update_time
 
-            if time_since_update >= (self.net_stats_interval / 1000.0):
+            # net_stats_interval is in ms; compare in integer ns
+            if time_since_update >= self.net_stats_interval * 1_000_000:
                 net = psutil.net_io_counters()
                 bytes_sent_delta = net.bytes_sent - self.cached_net_io.bytes_sent
                 bytes_recv_delta = net.bytes_recv - self.cached_net_io.bytes_recv
@@ -3691,7 +4688,7 @@ class DedSecOS:
                 # Check if significant change detected (1KB threshold)
                 if total_delta > self.net_delta_threshold:
                     # Significant activity detected, reset backoff and update
-                    dt = now - self.last_net_time
+                    dt = (now - self.last_net_time) / _NS_PER_SEC
                     if dt > 0.5:
                         up_kbps = (bytes_sent_delta * 8) / 1000 / dt
                         self.canvas.itemconfig(self.id_net_up_text, text=f"{up_kbps:.0f}K")
@@ -3728,9 +4725,6 @@ class DedSecOS:
 
     def update_network_icon(self):
         try:
-            for item in self.id_net_icon_group:
-                self.canvas.delete(item)
-            self.id_net_icon_group = []
             stats = psutil.net_if_stats()
             conn_type = "NONE"
             if "eth0" in stats and stats["eth0"].isup:
@@ -3738,42 +4732,44 @@ class DedSecOS:
             elif "wlan0" in stats and stats["wlan0"].isup:
                 conn_type = "WIFI"
 
-            icon_x = 235
-            if conn_type == "ETH":
-                self.id_net_icon_group.append(
-                    self.canvas.create_text(
-                        icon_x, 15, text="[<->]", fill=COLOR_FG, font=("monospace", 10, "bold")
-                    )
-                )
-            elif conn_type == "WIFI":
-                quality = 0
+            quality = 0
+            if conn_type == "WIFI":
                 try:
-                    with open("/proc/net/wireless") as f:
-                        lines = f.readlines()
-                        for line in lines:
-                            if "wlan0" in line:
-                                parts = line.split()
-                                q = float(parts[2].replace(".", ""))
-                                quality = int(q)
-                                if quality > 70:
-                                    quality = 100
-                                else:
-                                    quality = int((quality / 70) * 100)
+                    # Single binary read instead of line-by-line text decode;
+                    # the wlan0 row is located with find() and sliced to EOL
+                    with open("/proc/net/wireless", "rb") as f:
+                        data = f.read()
+                    idx = data.find(b"wlan0")
+                    if idx != -1:
+                        eol = data.find(b"\n", idx)
+                        parts = data[idx : eol if eol != -1 else len(data)].split()
+                        q = float(parts[2].replace(b".", b""))
+                        quality = int(q)
+                        if quality > 70:
+                            quality = 100
+                        else:
+                            quality = int((quality / 70) * 100)
                 except Exception:
                     quality = 0
-                bar_w = 3
-                gap = 2
-                start_x = 225
-                for i in range(4):
-                    h = 3 + (i * 2.5)
-                    x = start_x + (i * (bar_w + gap))
-                    y = 21  # Aligned to 30px header (was 18)
-                    threshold = i * 25
-                    color = COLOR_FG if quality > threshold else COLOR_GREY
-                    rect = self.canvas.create_rectangle(
-                        x, y - h, x + bar_w, y, fill=color, outline=""
+
+            # Quantize to the 25% steps the bars can actually display so an
+            # unchanged icon never touches the canvas
+            bucket = sum(1 for threshold in (0, 25, 50, 75) if quality > threshold)
+            state = (conn_type, bucket)
+            if state != self._net_icon_state:
+                prev_type = self._net_icon_state[0] if self._net_icon_state else None
+                if conn_type != prev_type:
+                    # Show/hide the pre-created items; nothing is ever recreated
+                    self.canvas.itemconfigure(
+                        self._eth_text, state="normal" if conn_type == "ETH" else "hidden"
                     )
-                    self.id_net_icon_group.append(rect)
+                    bar_state = "normal" if conn_type == "WIFI" else "hidden"
+                    for rect in self._wifi_bars:
+                        self.canvas.itemconfigure(rect, state=bar_state)
+                if conn_type == "WIFI":
+                    for i, rect in enumerate(self._wifi_bars):
+                        self.canvas.itemconfig(rect, fill=COLOR_FG if bucket > i else COLOR_GREY)
+                self._net_icon_state = state
         except Exception as e:
             log_error(f"Network Icon Error: {e}")
         self.root.after(self.current_intervals["network"], self.update_network_icon)
@@ -3841,15 +4837,64 @@ class DedSecOS:
         Args:
             text: Text to log (full line, not wrapped)
         """
-        # Just append the full line - no wrapping
+        # Just append the full line - no wrapping; the deque's maxlen
+        # drops the oldest scrollback automatically
         self.log_lines.append(text if text else "")
 
-        # Limit total lines to prevent memory issues (keep last 200 lines)
-        if len(self.log_lines) > 200:
-            self.log_lines = self.log_lines[-200:]
+        self.scroll_to_bottom()
+        self._request_redraw()
+
+    def log_block(self, lines):
+        """
+        Append many terminal lines with a single scroll/redraw.
+
+        Background tasks should schedule one of these per result set
+        rather than one log_line per line. Redraws coalesce via
+        _request_redraw either way; this also skips the per-line
+        scroll bookkeeping.
 
+        Args:
+            lines: Iterable of lines (empty strings preserved as blanks)
+        """
+        for text in lines:
+            self.log_lines.append(text if text else "")
         self.scroll_to_bottom()
-        self.draw_terminal()
+        self._request_redraw()
+
+    def _ui_emit(self, kind, *args):
+        """
+        Queue a terminal/status mutation for the next idle flush.
+
+        Scan events emit 3-6 log_line/update_status calls in sequence;
+        queued here they collapse into one log_block insert plus one
+        status configure instead of a redraw each. Safe from worker
+        threads - deque.append is atomic and the flush runs on the Tk
+        thread via after_idle.
+
+        Args:
+            kind: "log" or "status"
+            *args: the log text, or the update_status (text, [color])
+        """
+        self._ui_queue.append((kind, args))
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after_idle(self._ui_flush)
+
+    def _ui_flush(self):
+        """Drain queued emissions: one terminal redraw, one status set."""
+        self._ui_flush_scheduled = False
+        lines = []
+        status = None
+        while self._ui_queue:
+            kind, args = self._ui_queue.popleft()
+            if kind == "log":
+                lines.append(args[0])
+            else:
+                status = args
+        if lines:
+            self.log_block(lines)
+        if status is not None:
+            self.update_status(*status)
 
     def update_status(self, text, color=None):
         """Update status bar message (3.1.2.1).
@@ -3882,10 +4927,8 @@ class DedSecOS:
 
         log_error("[SHUTDOWN] Shutting down thread pool...")
         # Cancel all pending/running futures (1.3.1)
-        with self.lock:
-            for future in self.active_futures:
-                future.cancel()
-            self.active_futures.clear()
+        while self.active_futures:
+            self.active_futures.popleft().cancel()
 
         # Shutdown thread pool
         self.thread_pool.shutdown(wait=False, cancel_futures=True)
@@ -3897,6 +4940,7 @@ class DedSecOS:
             self.scroll_y = -(total_height - self.term_height)
         else:
             self.scroll_y = 0
+        self._scrollbar_dirty = True
 
 
 if __name__ == "__main__":